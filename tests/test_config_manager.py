@@ -0,0 +1,43 @@
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.config_manager import AppConfig
+
+
+def test_load_from_file_returns_independent_configs(tmp_path):
+    """Two loads of an unchanged file share no mutable state"""
+    path = str(tmp_path / "config.json")
+    AppConfig().save_to_file(path)
+
+    first = AppConfig.load_from_file(path)
+    second = AppConfig.load_from_file(path)
+    assert first is not second
+    assert first.trading is not second.trading
+
+    first.trading["runner"] = 3
+    first.account = {"high_water_mark": 5}
+    assert second.trading["runner"] == 1
+    assert AppConfig.load_from_file(path).account["high_water_mark"] == 1000000
+
+
+def test_load_from_file_sees_saved_changes(tmp_path):
+    """A save replaces the cached data for the path"""
+    path = str(tmp_path / "config.json")
+    AppConfig().save_to_file(path)
+
+    first = AppConfig.load_from_file(path)
+    first.trading["runner"] = 3
+    first.save_to_file(path)
+    assert AppConfig.load_from_file(path).trading["runner"] == 3
+
+
+def test_save_to_file_fast_round_trip(tmp_path):
+    """The shutdown save path writes the same JSON that load_from_file reads"""
+    path = str(tmp_path / "config.json")
+    config = AppConfig()
+    config.trading["underlying_symbol"] = "SPY"
+    config.save_to_file_fast(path)
+
+    assert AppConfig.load_from_file(path).trading["underlying_symbol"] == "SPY"
+    assert not os.path.exists(path + ".tmp")
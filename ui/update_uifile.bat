@@ -1 +1,3 @@
-pyuic6 -x main.ui -o ib_trading_gui.py
\ No newline at end of file
+pyuic6 -x main.ui -o ib_trading_gui.py
+pyuic6 -x settings.ui -o settings_gui.py
+pyuic6 -x ai_prompt.ui -o ai_prompt_gui.py
\ No newline at end of file
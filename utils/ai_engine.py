@@ -4,7 +4,7 @@ import threading
 from datetime import datetime, timedelta
 from typing import Dict, Any, Optional, List
 from dataclasses import dataclass
-from PyQt6.QtCore import QObject, pyqtSignal, QTimer
+from PyQt6.QtCore import QObject, pyqtSignal, QTimer, QThreadPool
 import google.generativeai as genai
 from utils.config_manager import AppConfig
 from utils.logger import get_logger
@@ -49,6 +49,9 @@ class AI_Engine(QObject):
     polling_status = pyqtSignal(str)   # Emits polling status updates
     cache_status = pyqtSignal(str)     # Emits cache status updates
     
+    # Longest cleanup waits for an in-flight analysis to wind down
+    CLEANUP_TIMEOUT_MS = 2000
+    
     def __init__(self, config: AppConfig, data_collector=None):
         super().__init__()
         self.config = config
@@ -67,6 +70,13 @@ class AI_Engine(QObject):
         self.last_poll_time: Optional[datetime] = None
         self.is_polling = False
         
+        # One reusable worker thread for analysis runs; overlapping requests queue up
+        # instead of each spawning a new thread
+        self._pool = QThreadPool()
+        self._pool.setMaxThreadCount(1)
+        # Set by cleanup so an in-flight analysis stops waiting on the network
+        self._shutting_down = False
+        
         # Timers for intelligent polling
         self.polling_timer = QTimer()
         self.polling_timer.timeout.connect(self._scheduled_poll)
@@ -129,23 +139,33 @@ class AI_Engine(QObject):
         
         logger.info("Executing scheduled AI poll")
         
-        # Run the analysis in a separate thread to avoid blocking the UI
-        def run_scheduled_analysis():
+        # Run the analysis on the worker pool to avoid blocking the UI
+        self._run_analysis_in_pool(self.analyze_market_data, "Scheduled poll")
+    
+    def trigger_analysis(self, label: str = "Triggered analysis") -> bool:
+        """Start an analysis on the worker pool unless one is already running or queued"""
+        if self.is_polling or self._pool.activeThreadCount() > 0:
+            logger.debug(f"Skipping {label.lower()} - another analysis in progress")
+            return False
+        self._run_analysis_in_pool(self.analyze_market_data, label)
+        return True
+    
+    def _run_analysis_in_pool(self, analysis_coro, label: str, **kwargs):
+        """Run an async analysis coroutine function on the engine's worker pool"""
+        def run_analysis():
             try:
                 # Create a new event loop for this async operation
                 loop = asyncio.new_event_loop()
                 asyncio.set_event_loop(loop)
                 try:
-                    loop.run_until_complete(self.analyze_market_data())
+                    loop.run_until_complete(analysis_coro(**kwargs))
                 finally:
                     loop.close()
             except Exception as e:
-                logger.error(f"Error in scheduled poll: {e}")
-                self.analysis_error.emit(f"Scheduled poll failed: {e}")
+                logger.error(f"Error in {label.lower()}: {e}")
+                self.analysis_error.emit(f"{label} failed: {e}")
         
-        # Start the analysis in a background thread
-        analysis_thread = threading.Thread(target=run_scheduled_analysis, daemon=True)
-        analysis_thread.start()
+        self._pool.start(run_analysis)
     
     @monitor_function("AI_ENGINE.collect_historical_data", threshold_ms=5000)
     async def collect_historical_data(self, days: int = None) -> List[PricePoint]:
@@ -361,6 +381,40 @@ Please provide your analysis in the specified JSON format.
         self.cache_status.emit("Using cached analysis")
         return False
     
+    async def _call_in_daemon_thread(self, func, *args):
+        """Run a blocking call on a daemon thread and await it, giving up once cleanup starts.
+
+        The Gemini request cannot be interrupted; running it on a daemon thread keeps a slow
+        response from holding the process open after the window has closed.
+        """
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+
+        def deliver(setter, value):
+            if not future.done():
+                setter(value)
+
+        def target():
+            try:
+                result = func(*args)
+            except BaseException as e:
+                callback = (future.set_exception, e)
+            else:
+                callback = (future.set_result, result)
+            try:
+                loop.call_soon_threadsafe(deliver, *callback)
+            except RuntimeError:
+                # The analysis loop was closed after cleanup gave up on this call
+                pass
+
+        threading.Thread(target=target, name="AI_Engine-gemini", daemon=True).start()
+        while not future.done():
+            if self._shutting_down:
+                future.cancel()
+                raise Exception("AI engine is shutting down")
+            await asyncio.wait((future,), timeout=0.2)
+        return future.result()
+    
     @monitor_function("AI_ENGINE.call_gemini_api", threshold_ms=10000)
     async def _call_gemini_api(self, prompt: str) -> Optional[Dict[str, Any]]:
         """Make API call to Gemini"""
@@ -369,7 +423,7 @@ Please provide your analysis in the specified JSON format.
         
         try:
             logger.info("Making Gemini API call...")
-            response = await asyncio.to_thread(
+            response = await self._call_in_daemon_thread(
                 self.gemini_client.generate_content,
                 prompt
             )
@@ -564,23 +618,8 @@ Please provide your analysis in the specified JSON format.
         """Force a refresh of AI analysis, bypassing cache"""
         logger.info("Force refresh requested")
         
-        # Run the analysis in a separate thread to avoid blocking the UI
-        def run_analysis():
-            try:
-                # Create a new event loop for this async operation
-                loop = asyncio.new_event_loop()
-                asyncio.set_event_loop(loop)
-                try:
-                    loop.run_until_complete(self.analyze_market_data(force_refresh=True))
-                finally:
-                    loop.close()
-            except Exception as e:
-                logger.error(f"Error in force refresh: {e}")
-                self.analysis_error.emit(f"Force refresh failed: {e}")
-        
-        # Start the analysis in a background thread
-        analysis_thread = threading.Thread(target=run_analysis, daemon=True)
-        analysis_thread.start()
+        # Run the analysis on the worker pool to avoid blocking the UI
+        self._run_analysis_in_pool(self.analyze_market_data, "Force refresh", force_refresh=True)
     
     def get_config_status(self) -> Dict[str, Any]:
         """Get detailed configuration status for debugging"""
@@ -596,7 +635,13 @@ Please provide your analysis in the specified JSON format.
     
     def cleanup(self):
         """Cleanup resources"""
+        self._shutting_down = True
         self._stop_polling()
+        # Drop queued analysis runs and give the one in flight a bounded time to stop;
+        # it abandons a pending Gemini request, whose daemon thread does not block exit
+        self._pool.clear()
+        if not self._pool.waitForDone(self.CLEANUP_TIMEOUT_MS):
+            logger.warning("AI analysis still running after cleanup timeout")
         logger.info("AI Engine cleanup completed")
     
     # Backward compatibility methods
@@ -1,11 +1,23 @@
 import json
-from pathlib import Path
+import os
 from dataclasses import dataclass
-from typing import Dict, Any
+from typing import Dict, Any, Tuple
 from .logger import get_logger
 
 logger = get_logger("CONFIG_MANAGER")
 
+# Last JSON text known to be on disk per config path, used to skip redundant writes
+_last_written: Dict[str, str] = {}
+# Raw file text per config path with the mtime it was read at; a hit skips the file read,
+# and every load still parses its own copy, so callers never share mutable sections
+_text_cache: Dict[str, Tuple[int, str]] = {}
+
+
+def _remember_written(config_path: str, text: str):
+    """Record text as the file content of config_path and drop its cached text"""
+    _last_written[config_path] = text
+    _text_cache.pop(config_path, None)
+
 @dataclass
 class AppConfig:
     """Application configuration"""
@@ -133,37 +145,53 @@ class AppConfig:
     
     @classmethod
     def load_from_file(cls, config_path: str = 'config.json') -> 'AppConfig':
-        """Load configuration from JSON file"""
+        """Load configuration from JSON file (the file text is cached until its mtime changes)"""
         try:
-            if Path(config_path).exists():
+            try:
+                mtime = os.stat(config_path).st_mtime_ns
+            except FileNotFoundError:
+                return cls()
+            cached = _text_cache.get(config_path)
+            if cached is not None and cached[0] == mtime:
+                text = cached[1]
+            else:
                 with open(config_path, 'r') as f:
-                    config_data = json.load(f)
-                return cls(
-                    connection=config_data.get('connection'),
-                    trading=config_data.get('trading'), 
-                    performance=config_data.get('performance'),
-                    debug=config_data.get('debug'),
-                    ai_prompt=config_data.get('ai_prompt'),
-                    account=config_data.get('account')
-                )
+                    text = f.read()
+                # Single-key writes; a load racing a save only leaves a stale mtime behind
+                _text_cache[config_path] = (mtime, text)
+            config_data = json.loads(text)
+            _last_written[config_path] = text
+            return cls(
+                connection=config_data.get('connection'),
+                trading=config_data.get('trading'), 
+                performance=config_data.get('performance'),
+                debug=config_data.get('debug'),
+                ai_prompt=config_data.get('ai_prompt'),
+                account=config_data.get('account')
+            )
         except Exception as e:
             logger.warning(f"Failed to load config from {config_path}: {e}")
         
         return cls()
     
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the serializable configuration sections"""
+        return {
+            "connection": self.connection,
+            "trading": self.trading,
+            "performance": self.performance,
+            "debug": self.debug,
+            "ai_prompt": self.ai_prompt,
+            "account": self.account
+        }
+    
     def save_to_file(self, config_path: str = 'config.json'):
         """Save configuration to JSON file"""
         try:
-            config_dict = {
-                "connection": self.connection,
-                "trading": self.trading,
-                "performance": self.performance,
-                "debug": self.debug,
-                "ai_prompt": self.ai_prompt,
-                "account": self.account
-            }
+            text = json.dumps(self.to_dict(), indent=4)
             with open(config_path, 'w') as f:
-                json.dump(config_dict, f, indent=4)
+                f.write(text)
+            _remember_written(config_path, text)
             
             # Notify logger manager of configuration changes
             self._notify_logger_manager()
@@ -171,6 +199,21 @@ class AppConfig:
         except Exception as e:
             logger.error(f"Failed to save config to {config_path}: {e}")
     
+    def save_to_file_fast(self, config_path: str = 'config.json'):
+        """Save configuration on shutdown: skip unchanged content and write atomically"""
+        try:
+            text = json.dumps(self.to_dict(), indent=4)
+            if _last_written.get(config_path) == text:
+                logger.debug(f"Config unchanged, skipping write to {config_path}")
+                return
+            tmp_path = f"{config_path}.tmp"
+            with open(tmp_path, 'w') as f:
+                f.write(text)
+            os.replace(tmp_path, config_path)
+            _remember_written(config_path, text)
+        except Exception as e:
+            logger.error(f"Failed to save config to {config_path}: {e}")
+    
     def _notify_logger_manager(self):
         """Notify the logger manager of configuration changes"""
         try:
@@ -0,0 +1,50 @@
+import copy
+from PyQt6.QtCore import QObject, pyqtSignal, pyqtSlot
+from utils.config_manager import AppConfig
+from .logger import get_logger
+
+logger = get_logger("CONFIG_MANAGER")
+
+
+class ConfigSaver(QObject):
+    """Writes configuration snapshots to disk on its own thread.
+
+    Emit ``save`` with an AppConfig from the GUI thread; the queued connection runs
+    ``save_to_file`` on the thread this object was moved to, so the disk write never
+    blocks the event loop. Use ``request_save`` to emit a private copy, so the GUI can
+    keep editing its config while the write is in flight.
+    """
+    save = pyqtSignal(object)
+    final_save = pyqtSignal(object)
+
+    def __init__(self, config_path: str = 'config.json'):
+        super().__init__()
+        self.config_path = config_path
+        self.save.connect(self._on_save)
+        self.final_save.connect(self._on_final_save)
+
+    def request_save(self, config: AppConfig):
+        """Queue a save of a snapshot of config"""
+        self.save.emit(copy.deepcopy(config))
+
+    def request_final_save(self, config: AppConfig):
+        """Queue the shutdown save; the saver thread quits once it is written"""
+        self.final_save.emit(config)
+
+    @pyqtSlot(object)
+    def _on_save(self, config: AppConfig):
+        """Write the snapshot (runs on the saver thread)"""
+        try:
+            config.save_to_file(self.config_path)
+        except Exception as e:
+            logger.error(f"Background config save failed: {e}")
+
+    @pyqtSlot(object)
+    def _on_final_save(self, config: AppConfig):
+        """Write the shutdown snapshot after any queued saves, then stop the saver thread"""
+        try:
+            config.save_to_file_fast(self.config_path)
+        except Exception as e:
+            logger.error(f"Final config save failed: {e}")
+        finally:
+            self.thread().quit()
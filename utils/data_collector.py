@@ -4,6 +4,7 @@ from utils.ib_connection import IBDataCollector
 import asyncio
 import random
 import logging
+import pandas as pd
 from .logger import get_logger
 
 logger = get_logger("DATA_COLLECTOR")
@@ -25,6 +26,8 @@ class DataCollectorWorker(QObject):
     trading_config_updated = pyqtSignal(dict)  # Signal for trading configuration updates
     active_contracts_pnl_refreshed = pyqtSignal(dict)
     closed_trades_update = pyqtSignal(dict)
+    # data_ready payload keys whose DataFrame is reduced to a dict of its first row
+    ROW_PAYLOAD_KEYS = ('account', 'active_contract', 'options', 'statistics')
 
     def __init__(self, config: AppConfig):
         super().__init__()
@@ -44,6 +47,14 @@ class DataCollectorWorker(QObject):
         self._last_saved_high_water_mark = (
             self.config.account.get('high_water_mark') if self.config and self.config.account else None
         )
+        # Fingerprint of the last payload published via data_ready; data_ready is only
+        # emitted when the collected snapshot differs from it
+        self._last_hash = None
+        # debug.single_thread: polled from a GUI-thread timer instead of start_collection;
+        # IB is only serviced during a poll, so streaming updates and symbol refresh stop
+        self.single_thread = bool(config.debug.get('single_thread', False)) if config.debug else False
+        # Event loop reused across poll_once calls in single-thread mode
+        self._poll_loop = None
         
     def start_collection(self):
         """Start the data collection loop"""
@@ -113,6 +124,8 @@ class DataCollectorWorker(QObject):
             
             # Update the collector's trading configuration
             self.collector.trading_config = trading_config
+            # Force the next snapshot to be published; the GUI clears its labels on config changes
+            self._last_hash = None
             new_symbol = trading_config.get('underlying_symbol', self.collector.underlying_symbol)
             symbol_changed = new_symbol is not None and new_symbol != self.collector.underlying_symbol
             self.collector.underlying_symbol = new_symbol
@@ -146,7 +159,9 @@ class DataCollectorWorker(QObject):
             })
             
             # If connected and the symbol changed, immediately refresh subscriptions for new symbol
-            if symbol_changed and self.collector.ib.isConnected():
+            if symbol_changed and self.single_thread:
+                logger.warning("Symbol refresh is unavailable in single-thread mode; market data subscriptions keep the old symbol until reconnect")
+            elif symbol_changed and self.collector.ib.isConnected():
                 logger.info("Underlying symbol changed while connected - refreshing subscriptions for new symbol")
                 try:
                     # Run the async refresh on the collector's event loop
@@ -192,59 +207,103 @@ class DataCollectorWorker(QObject):
     async def _collection_loop(self):
         """Main data collection loop"""
         while self.is_running:
-            try:
-                # Check connection status
-                if not self.collector.ib.isConnected():
-                    logger.info(f"IB not connected. Manual disconnect flag: {self._manual_disconnect_requested}")
-                    self.connection_status_changed.emit(False)
-                    # Only attempt reconnection if manual disconnect was not requested
-                    if not self._manual_disconnect_requested:
-                        logger.info("Attempting automatic reconnection...")
-                        # Emit reconnection attempt signal for logging
-                        self.connection_success.emit({'status': 'Reconnecting...', 'message': f'Automatic reconnection attempt {self.reconnect_attempts + 1}'})
-                        if await self._reconnect():
-                            self.connection_status_changed.emit(True)
-                            self.reconnect_attempts = 0
-                        else:
-                            await self._sleep_with_cancel(self.config.reconnect_delay)
-                            continue
+            delay = await self._collect_once()
+            # Wait for next collection cycle
+            await self._sleep_with_cancel(delay)
+    
+    async def _collect_once(self, backoff: bool = True) -> float:
+        """Run one collection cycle and return the delay before the next one"""
+        try:
+            # Check connection status
+            if not self.collector.ib.isConnected():
+                logger.info(f"IB not connected. Manual disconnect flag: {self._manual_disconnect_requested}")
+                self.connection_status_changed.emit(False)
+                # Only attempt reconnection if manual disconnect was not requested
+                if not self._manual_disconnect_requested:
+                    logger.info("Attempting automatic reconnection...")
+                    # Emit reconnection attempt signal for logging
+                    self.connection_success.emit({'status': 'Reconnecting...', 'message': f'Automatic reconnection attempt {self.reconnect_attempts + 1}'})
+                    if await self._reconnect(backoff):
+                        self.connection_status_changed.emit(True)
+                        self.reconnect_attempts = 0
                     else:
-                        # Manual disconnect was requested, don't reconnect automatically
-                        logger.info("Manual disconnect requested, skipping automatic reconnection")
-                        await self._sleep_with_cancel(self.config.data_collection_interval)
-                        continue
-                
-                # Collect data
-                data = await self.collector.collect_all_data()
-                if data:
-                    self.data_ready.emit(data)
+                        return self.config.reconnect_delay
+                else:
+                    # Manual disconnect was requested, don't reconnect automatically
+                    logger.info("Manual disconnect requested, skipping automatic reconnection")
+                    return self.config.data_collection_interval
+            
+            # Collect data
+            data = await self.collector.collect_all_data()
+            if data:
+                fingerprint = self._payload_fingerprint(data)
+                if fingerprint is None or fingerprint != self._last_hash:
+                    self._last_hash = fingerprint
+                    self.data_ready.emit(self._project_rows(data))
                     logger.info("Data collection completed successfully")
-
-                    # Persist updated high water mark if it changed
-                    try:
-                        current_hwm = self.collector.account_config.get('high_water_mark') if self.collector.account_config else None
-                        if current_hwm is not None and current_hwm != self._last_saved_high_water_mark:
-                            # Reflect into AppConfig and persist
-                            if self.config and self.config.account is not None:
-                                self.config.account['high_water_mark'] = current_hwm
-                                self.config.save_to_file()
-                                self._last_saved_high_water_mark = current_hwm
-                                logger.info(f"Persisted updated High Water Mark: {current_hwm}")
-                    except Exception as persist_err:
-                        logger.warning(f"Could not persist High Water Mark: {persist_err}")
                 else:
-                    logger.warning("Data collection returned None")
-                
-                # Wait for next collection cycle
-                await self._sleep_with_cancel(self.config.data_collection_interval)
-                
-            except Exception as e:
-                logger.error(f"Error in data collection loop: {e}")
-                self.error_occurred.emit(str(e))
-                await self._sleep_with_cancel(self.config.reconnect_delay)
+                    logger.debug("Collected data unchanged, skipping data_ready emission")
+
+                # Persist updated high water mark if it changed
+                try:
+                    current_hwm = self.collector.account_config.get('high_water_mark') if self.collector.account_config else None
+                    if current_hwm is not None and current_hwm != self._last_saved_high_water_mark:
+                        # Reflect into AppConfig and persist
+                        if self.config and self.config.account is not None:
+                            self.config.account['high_water_mark'] = current_hwm
+                            self.config.save_to_file()
+                            self._last_saved_high_water_mark = current_hwm
+                            logger.info(f"Persisted updated High Water Mark: {current_hwm}")
+                except Exception as persist_err:
+                    logger.warning(f"Could not persist High Water Mark: {persist_err}")
+            else:
+                logger.warning("Data collection returned None")
+            
+            return self.config.data_collection_interval
+            
+        except Exception as e:
+            logger.error(f"Error in data collection loop: {e}")
+            self.error_occurred.emit(str(e))
+            return self.config.reconnect_delay
+    
+    def poll_once(self):
+        """Run a single collection cycle on the caller's thread (debug.single_thread mode)"""
+        if self._poll_loop is None:
+            self._poll_loop = asyncio.new_event_loop()
+        self.is_running = True
+        try:
+            # The poll timer already spaces out attempts; a backoff sleep here would freeze the GUI
+            self._poll_loop.run_until_complete(self._collect_once(backoff=False))
+        except Exception as e:
+            logger.error(f"Error in single-thread poll: {e}")
+    
+    @classmethod
+    def _project_rows(cls, data):
+        """Replace the single-row frames the GUI reads with plain dicts of their first row"""
+        for key in cls.ROW_PAYLOAD_KEYS:
+            value = data.get(key)
+            if isinstance(value, pd.DataFrame):
+                data[key] = value.iloc[0].to_dict() if not value.empty else None
+        return data
     
-    async def _reconnect(self) -> bool:
-        """Attempt to reconnect with exponential backoff"""
+    @staticmethod
+    def _payload_fingerprint(data):
+        """Build a hashable fingerprint of a collected data dict, or None if it cannot be hashed"""
+        try:
+            parts = []
+            for key in sorted(data):
+                value = data[key]
+                if isinstance(value, pd.DataFrame):
+                    value = int(pd.util.hash_pandas_object(value, index=True).sum())
+                parts.append((key, value))
+            fingerprint = tuple(parts)
+            hash(fingerprint)
+            return fingerprint
+        except Exception:
+            return None
+
+    async def _reconnect(self, backoff: bool = True) -> bool:
+        """Attempt to reconnect, with exponential backoff unless backoff is False"""
         if self.reconnect_attempts >= self.config.max_reconnect_attempts:
             logger.error("Max reconnection attempts reached")
             return False
@@ -259,7 +318,8 @@ class DataCollectorWorker(QObject):
             logger.info(f"Using connection settings - Host: {self.collector.host}, Port: {self.collector.port}, Client ID: {self.collector.clientId}")
             
             # Allow prompt shutdown during backoff sleep
-            await self._sleep_with_cancel(delay)
+            if backoff:
+                await self._sleep_with_cancel(delay)
             if not self.is_running:
                 return False
             success = await self.collector.connect()
@@ -290,6 +350,10 @@ class DataCollectorWorker(QObject):
             logger.info("Disconnected from IB")
         except Exception as e:
             logger.error(f"Error during cleanup: {e}")
+        finally:
+            if self._poll_loop is not None and not self._poll_loop.is_running():
+                self._poll_loop.close()
+                self._poll_loop = None
 
     async def _sleep_with_cancel(self, total_seconds: float):
         """Sleep in short intervals so we can react quickly to stop requests."""
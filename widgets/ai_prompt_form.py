@@ -205,8 +205,7 @@ class AI_Prompt_Form(QDialog):
             
         except Exception as e:
             logger.error(f"Error creating advanced UI: {e}")
-            import traceback
-            logger.error(f"Traceback: {traceback.format_exc()}")
+            logger.debug("Advanced UI creation traceback", exc_info=True)
     
     def _verify_advanced_ui(self):
         """Verify that advanced UI widgets were created and are visible"""
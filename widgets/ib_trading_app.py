@@ -1,35 +1,160 @@
 from ui.ib_trading_gui import Ui_MainWindow
 from utils.config_manager import AppConfig
-from widgets.settings_form import Settings_Form
+from widgets.settings_form import Settings_Form, LOG_LEVEL_COMBOS
 from widgets.ai_prompt_form import AI_Prompt_Form
 
 from utils.data_collector import DataCollectorWorker
 from utils.ai_engine import AI_Engine
 from utils.hotkey_manager import HotkeyManager
+from utils.config_saver import ConfigSaver
 
-from typing import Dict, Any, Union, List
-from datetime import datetime
+from typing import Dict, Any, Union, List, Optional
+from dataclasses import dataclass
+from types import SimpleNamespace
+import functools
+import time
+import json
+import logging
+import re
 from utils.logger import get_logger
 
 logger = get_logger("GUI")
 
+# Placeholder shown in data labels that have no value
+_DASH = "---"
+
 # Helper to consistently format currency values like $1,000,000.00
 def format_currency(value) -> str:
     try:
         if isinstance(value, str):
             cleaned = value.replace(",", "").replace("$", "").strip()
-            if cleaned in ("", "---"):
-                return "---"
+            if cleaned in ("", _DASH):
+                return _DASH
             val = float(cleaned)
         else:
             val = float(value)
     except Exception:
-        return "---" if value in (None, "", "---") else str(value)
+        return _DASH if value in (None, "", _DASH) else str(value)
     sign = "-" if val < 0 else ""
     return f"{sign}${abs(val):,.2f}"
+
+# Keywords counted by _determine_ai_bias, matched as whole words in a single scan
+_BULL_RE = re.compile(r"\b(?:bullish|bull|upward|higher|support|buy|long)\b")
+_BEAR_RE = re.compile(r"\b(?:bearish|bear|downward|lower|resistance|sell|short)\b")
+
+@dataclass(slots=True)
+class _PreparedAnalysis:
+    """Fields of an AI analysis payload, extracted once for the insights formatters"""
+    low: float
+    high: float
+    summary: str
+    insights: List[str]
+    confidence: float
+    risk: str
+    alerts: List[str]
+    # Lowercased summary and insights, scanned for bias keywords
+    text_lower: str
+
+    @classmethod
+    def from_dict(cls, analysis_data: Dict[str, Any]) -> '_PreparedAnalysis':
+        price_range = analysis_data.get('valid_price_range', {}) or {}
+        summary = analysis_data.get('analysis_summary', '') or ''
+        insights = analysis_data.get('key_insights', []) or []
+        return cls(
+            low=price_range.get('low', 0),
+            high=price_range.get('high', 0),
+            summary=summary,
+            insights=insights,
+            confidence=analysis_data.get('confidence_level', 0.0),
+            risk=analysis_data.get('risk_assessment', ''),
+            alerts=analysis_data.get('alerts', []),
+            text_lower=(summary + ' ' + ' '.join(insights)).lower(),
+        )
+
+    def signature(self, *extra) -> Optional[int]:
+        """Hash of the displayed fields, or None if the payload holds unhashable items"""
+        try:
+            return hash((self.low, self.high, self.summary, tuple(self.insights), self.confidence,
+                         self.risk, tuple(self.alerts)) + extra)
+        except TypeError:
+            return None
+
+# Shown when the AI key levels are unavailable
+_NA = "N/A"
+
+# AI bias labels returned by _determine_ai_bias
+_BIAS_BULLISH = "Bullish"
+_BIAS_BEARISH = "Bearish"
+_BIAS_NEUTRAL = "Neutral"
+
+# Pre-bound formatters for values rendered on every data update
+_FMT_FX = "{:.4f}".format
+# Option Greeks use the same four decimals as FX rates
+_FMT_GREEK = _FMT_FX
+_FMT_PCT = "{}%".format
+_FMT_RATE = "{:.2f}%".format
+_FMT_RAW = "{}".format
+_FMT_KEY_LEVELS = "{} - {}".format
+
+
+def _fmt_loss(value) -> str:
+    """Format a losses total as a negative currency amount"""
+    return format_currency(-abs(value))
+
+
+@functools.lru_cache(maxsize=32)
+def _fmt_expiration(raw) -> str:
+    """Display an IB expiration: "20250810" -> "2025-08-10"; other values as-is"""
+    if isinstance(raw, str) and len(raw) == 8 and raw.isdigit():
+        return f"{raw[:4]}-{raw[4:6]}-{raw[6:]}"
+    return f"{raw}"
+
+
+# Connection status stylesheet, parsed once; the colour follows the label's "connected" property
+_SS_CONNECTION_STATUS = 'QLabel[connected="true"] { color: green; } QLabel[connected="false"] { color: red; }'
+
+
+# Helper to fingerprint a row payload so identical snapshots can be skipped
+def row_hash(row: Dict[str, Any]) -> Optional[int]:
+    try:
+        return hash(tuple(row.items()))
+    except Exception:
+        # Unhashable cell contents; treat as always changed
+        return None
+
+
+# (DataCollectorWorker signal, IB_Trading_APP slot) pairs wired up in __init__
+_SIGNAL_MAP = (
+    ("data_ready", "update_ui_with_data"),
+    ("connection_status_changed", "update_connection_status"),
+    ("error_occurred", "handle_error"),
+    ("price_updated", "update_real_time_price"),
+    ("fx_rate_updated", "update_fx_rate"),
+    ("connection_success", "update_connection_status"),
+    ("connection_disconnected", "update_connection_status"),
+    ("calls_option_updated", "update_calls_option"),
+    ("puts_option_updated", "update_puts_option"),
+    ("daily_pnl_update", "update_daily_pnl_updated"),
+    ("account_summary_update", "update_account_summary"),
+    ("trading_config_updated", "on_trading_config_updated"),
+    ("active_contracts_pnl_refreshed", "update_active_contracts_pnl"),
+    ("closed_trades_update", "update_closed_trades"),
+)
+
+# Widgets the generated main window must provide; checked once in setup_ui so the
+# per-tick paths can use them without hasattr guards
+_REQUIRED_UI_ATTRS = ('label_time', 'label_connection_status')
+
+# (optional button, slot name) pairs wired in setup_ui when the generated UI provides them
+_BUTTON_SLOTS = (
+    ('pushButton_settings', 'show_setting_ui'),
+    ('button_ai_prompt', 'show_ai_prompt_ui'),
+    ('button_refresh_ai', 'refresh_ai'),
+)
+
 try:
     from PyQt6.QtWidgets import QMainWindow, QMessageBox
-    from PyQt6.QtCore import QThread, QTimer
+    from PyQt6.QtCore import QCoreApplication, QThread, QTimer, QTime
     logger.debug("PyQt6 imports successful")
 except ImportError as e:
     logger.error(f"PyQt6 import failed: {e}")
@@ -37,9 +162,110 @@ except ImportError as e:
 
 
 class IB_Trading_APP(QMainWindow):
+    # (config section, key, settings widget, caster) for the plain text fields of the settings form
+    _SETTING_SCHEMA = (
+        ('connection', 'host', 'hostEdit', str),
+        ('connection', 'port', 'portEdit', int),
+        ('connection', 'client_id', 'clientIdEdit', int),
+        ('trading', 'underlying_symbol', 'underlyingSymbolEdit', str),
+        ('trading', 'trade_delta', 'tradeDeltaEdit', float),
+        ('trading', 'max_trade_value', 'maxTradeValueEdit', float),
+        ('trading', 'runner', 'runnerEdit', int),
+    )
+    # (label, option data key, formatter) for the calls and puts panels
+    _CALLS_MAP = (
+        ('call_price_value', 'Last', _FMT_RAW),
+        ('call_bid_value', 'Bid', _FMT_RAW),
+        ('call_ask_value', 'Ask', _FMT_RAW),
+        ('call_delta_value', 'Delta', _FMT_GREEK),
+        ('call_gamma_value', 'Gamma', _FMT_GREEK),
+        ('call_theta_value', 'Theta', _FMT_GREEK),
+        ('call_vega_value', 'Vega', _FMT_GREEK),
+        ('call_openint_value', 'Call_Open_Interest', _FMT_RAW),
+        ('call_volume_value', 'Volume', _FMT_RAW),
+    )
+    _PUTS_MAP = (
+        ('put_price_value', 'Last', _FMT_RAW),
+        ('put_bid_value', 'Bid', _FMT_RAW),
+        ('put_ask_value', 'Ask', _FMT_RAW),
+        ('put_delta_value', 'Delta', _FMT_GREEK),
+        ('put_gamma_value', 'Gamma', _FMT_GREEK),
+        ('put_theta_value', 'Theta', _FMT_GREEK),
+        ('put_vega_value', 'Vega', _FMT_GREEK),
+        ('put_openint_value', 'Put_Open_Interest', _FMT_RAW),
+        ('put_volume_value', 'Volume', _FMT_RAW),
+    )
+    # (label, statistics key, formatter) shared by the statistics and closed trades updates
+    _STATS_MAP = (
+        ('total_trades_value', 'Total_Trades', _FMT_RAW),
+        ('total_wins_count_value', 'Total_Wins_Count', _FMT_RAW),
+        ('total_losses_count_value', 'Total_Losses_Count', _FMT_RAW),
+        ('total_losses_sum_value', 'Total_Losses_Sum', _fmt_loss),
+        ('total_wins_sum_value', 'Total_Wins_Sum', format_currency),
+    )
+    # Labels cleared when the underlying symbol changes
+    _SYMBOL_LABELS = (
+        'spy_value', 'symbol_value', 'quantity_value', 'pl_dollar_value', 'pl_percent_value',
+        'strike_value', 'expiration_value',
+    )
+    _OPTION_LABELS = tuple(name for name, _, _ in _CALLS_MAP + _PUTS_MAP)
+    # Every data-driven label, cleared at startup
+    _WHITESPACE_LABELS = (
+        ('spy_name', 'usd_cad_value', 'cad_usd_value', 'account_value_value') + _SYMBOL_LABELS + _OPTION_LABELS + (
+            'starting_value_value', 'high_water_value', 'daily_pl_value', 'daily_pl_percent_value',
+            'win_rate_value',
+        ) + tuple(name for name, _, _ in _STATS_MAP)
+    )
+    # Each label appears once, so a reset never writes the same widget twice
+    assert len(set(_WHITESPACE_LABELS)) == len(_WHITESPACE_LABELS), "duplicate label in _WHITESPACE_LABELS"
+    # Delay before queued label writes are flushed to the widgets (~20 Hz)
+    UI_FLUSH_INTERVAL_MS = 50
+    # Minimum seconds between modal connection-error dialogs
+    ERROR_POPUP_INTERVAL = 30
+    # How long closeEvent waits for the data collection thread before closing anyway
+    SHUTDOWN_TIMEOUT_MS = 5000
+    # Longest closeEvent waits for the final configuration write
+    FINAL_SAVE_TIMEOUT_MS = 2000
+    # Column order of the settings riskLevelsTable
+    _RISK_LEVEL_KEYS = ('loss_threshold', 'account_trade_limit', 'stop_loss', 'profit_gain')
+
     def __init__(self):
         super().__init__()
         self.refresh_timer = None
+        # Coalesced label writes (label attribute name -> latest text), flushed at display rate
+        self._pending: Dict[str, str] = {}
+        # Text last written to each label, so unchanged values skip setText and its repaint
+        self._shown: Dict[str, str] = {}
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(self.UI_FLUSH_INTERVAL_MS)
+        self._flush_timer.timeout.connect(self._flush_ui)
+        # Clock state: last rendered second of the local day
+        self._last_sec = -1
+        # Payload fingerprints used to skip re-rendering identical snapshots
+        self._active_contract_hash = None
+        self._options_hash = None
+        self._statistics_hash = None
+        self._last_error_popup = 0.0
+        # Signature of the AI insights currently on screen
+        self._last_analysis_sig = None
+        # Non-blocking shutdown state (see closeEvent)
+        self._shutting_down = False
+        self._shutdown_timed_out = False
+        # Last connection status applied to the status widgets
+        self._last_conn_status = None
+        # "connected" property currently set on the connection status label
+        self._conn_connected = None
+        # Last USD/CAD rate shown: (rate, usd_cad_text, cad_usd_text)
+        self._fx_cache = (None, None, None)
+        # Last (NetLiquidation, StartingValue, HighWaterMark) shown
+        self._acct_cache = None
+        # data_ready coalescing: latest payload held back until the minimum UI interval elapses
+        self._last_ui_update = 0.0
+        self._pending_data = None
+        self._pending_data_timer = QTimer(self)
+        self._pending_data_timer.setSingleShot(True)
+        self._pending_data_timer.timeout.connect(self._apply_pending_data)
         self.ui = Ui_MainWindow()
         self.ui.setupUi(self)
 
@@ -66,13 +292,36 @@ class IB_Trading_APP(QMainWindow):
             except Exception:
                 self._last_trading_config_snapshot = {}
         
+        self._refresh_config_cache()
+        
+        # Settings saves are written to disk on a dedicated thread
+        self._saver_thread = QThread()
+        self._saver = ConfigSaver()
+        self._saver.moveToThread(self._saver_thread)
+        self._saver_thread.start()
+        
         self.connection_status = 'disconnected'
+        # In single-thread debug mode the worker stays on the GUI thread and is polled by a
+        # QTimer, so its signals become direct calls instead of queued cross-thread events
+        self.single_thread = bool(self.config.debug.get('single_thread', False)) if self.config.debug else False
+        if self.single_thread:
+            logger.warning(
+                "debug.single_thread is enabled (debug only): IB is serviced only while the poll timer runs, "
+                "so streaming ticks stall between polls, symbol refresh is unavailable and reconnect "
+                "attempts are spent one per poll"
+            )
+        self.poll_timer = None
+        max_fps = self.config.performance.get('max_ui_fps', 10) if self.config.performance else 10
+        self._min_ui_interval = 1.0 / max_fps if max_fps and max_fps > 0 else 0.0
         # Initialize data collector worker
         try:
             logger.debug("Initializing data collector worker...")
             self.data_worker = DataCollectorWorker(self.config)
-            self.worker_thread = QThread()
-            self.data_worker.moveToThread(self.worker_thread)
+            if self.single_thread:
+                self.worker_thread = None
+            else:
+                self.worker_thread = QThread()
+                self.data_worker.moveToThread(self.worker_thread)
             logger.debug("Data collector worker initialized successfully")
         except Exception as e2:
             logger.error(f"Failed to initialize data collector worker: {e2}")
@@ -80,111 +329,28 @@ class IB_Trading_APP(QMainWindow):
             self.worker_thread = None
         
         # Connect signals
-        if self.data_worker and self.worker_thread:
+        if self.data_worker:
             try:
-                self.data_worker.data_ready.connect(self.update_ui_with_data)
-                self.data_worker.connection_status_changed.connect(self.update_connection_status)
-                self.data_worker.error_occurred.connect(self.handle_error)
-                self.data_worker.price_updated.connect(self.update_real_time_price)
-                self.data_worker.fx_rate_updated.connect(self.update_fx_rate)
-                self.data_worker.connection_success.connect(self.update_connection_status)
-                self.data_worker.connection_disconnected.connect(self.update_connection_status)
-                self.data_worker.calls_option_updated.connect(self.update_calls_option)
-                self.data_worker.puts_option_updated.connect(self.update_puts_option)
-                self.data_worker.daily_pnl_update.connect(self.update_daily_pnl_updated)
-                self.data_worker.account_summary_update.connect(self.update_account_summary)
-                self.data_worker.trading_config_updated.connect(self.on_trading_config_updated)
-                self.data_worker.active_contracts_pnl_refreshed.connect(self.update_active_contracts_pnl)
-                self.data_worker.closed_trades_update.connect(self.update_closed_trades)
+                for signal_name, slot_name in _SIGNAL_MAP:
+                    getattr(self.data_worker, signal_name).connect(getattr(self, slot_name))
                 # Connect thread signals
-                self.worker_thread.started.connect(self.data_worker.start_collection)
-                self.worker_thread.finished.connect(self.data_worker.cleanup)
+                if self.worker_thread:
+                    self.worker_thread.started.connect(self.data_worker.start_collection)
+                    self.worker_thread.finished.connect(self.data_worker.cleanup)
+                    self.worker_thread.finished.connect(self.data_worker.deleteLater)
                 logger.debug("Data worker signals connected successfully")
             except Exception as e3:
                 logger.error(f"Failed to connect data worker signals: {e3}")
         else:
             logger.warning("Data worker not available, skipping signal connections")
         
+        # Settings and AI prompt dialogs are built on first use
+        self.setting_ui = None
+        self.ai_prompt_ui = None
+        
         # Setup UI
         self.setup_ui()
         
-        # Initialize UI forms with error handling
-        try:
-            logger.debug("Initializing Settings_Form...")
-            # Check if required UI files exist
-            import os
-            ui_file_path = os.path.join(os.path.dirname(__file__), '..', 'ui', 'settings_gui.py')
-            if not os.path.exists(ui_file_path):
-                logger.error(f"UI file not found: {ui_file_path}")
-                raise FileNotFoundError(f"UI file not found: {ui_file_path}")
-            
-            # Check if main UI file exists
-            main_ui_file_path = os.path.join(os.path.dirname(__file__), '..', 'ui', 'ib_trading_gui.py')
-            if not os.path.exists(main_ui_file_path):
-                logger.error(f"Main UI file not found: {main_ui_file_path}")
-                raise FileNotFoundError(f"Main UI file not found: {main_ui_file_path}")
-            
-            self.setting_ui = Settings_Form(self.config, self.connection_status, self.data_worker)
-            logger.debug("Settings_Form initialized successfully")
-            
-            logger.debug("Initializing AIPrompt_Form...")
-            # Check if required AI prompt UI file exists
-            ai_ui_file_path = os.path.join(os.path.dirname(__file__), '..', 'ui', 'ai_prompt_gui.py')
-            if not os.path.exists(ai_ui_file_path):
-                logger.error(f"AI Prompt UI file not found: {ai_ui_file_path}")
-                raise FileNotFoundError(f"AI Prompt UI file not found: {ai_ui_file_path}")
-            
-            self.ai_prompt_ui = AI_Prompt_Form(self.config, self.refresh_ai)
-            logger.debug("AIPrompt_Form initialized successfully")
-            
-            # Connect form signals
-            if hasattr(self.setting_ui.ui, 'cancelButton'):
-                self.setting_ui.ui.cancelButton.clicked.connect(self._close_setting_form)
-            if hasattr(self.setting_ui.ui, 'saveButton'):
-                self.setting_ui.ui.saveButton.clicked.connect(self._save_setting_form)
-            
-            # Connect settings form to data worker signals for connection status updates
-            if self.setting_ui and self.data_worker:
-                try:
-                    def on_connection_success(data):
-                        status = data.get('status', 'Connected')
-                        message = data.get('message', '')
-                        logger.info(f"Main app: Connection success signal received: {status}")
-                        self.setting_ui.update_connection_status(status)
-                        if message and hasattr(self.setting_ui, 'log_connection_event'):
-                            self.setting_ui.log_connection_event(message, "Info")
-                    
-                    def on_connection_disconnected(data):
-                        status = data.get('status', 'Disconnected')
-                        message = data.get('message', '')
-                        logger.info(f"Main app: Connection disconnected signal received: {status}")
-                        self.setting_ui.update_connection_status(status)
-                        if message and hasattr(self.setting_ui, 'log_connection_event'):
-                            self.setting_ui.log_connection_event(message, "Info")
-                    
-                    def on_error(msg):
-                        logger.warning(f"Main app: Error signal received: {msg}")
-                        self.setting_ui.update_connection_status("Error")
-                        if hasattr(self.setting_ui, 'log_connection_event'):
-                            self.setting_ui.log_connection_event(msg, "Error")
-                    
-                    self.data_worker.connection_success.connect(on_connection_success)
-                    self.data_worker.connection_disconnected.connect(on_connection_disconnected)
-                    self.data_worker.error_occurred.connect(on_error)
-                    logger.debug("Settings form signal connections established")
-                except Exception as e3:
-                    logger.error(f"Failed to connect settings form signals: {e3}")
-                
-        except Exception as e3:
-            logger.error(f"Error initializing UI forms: {e3}")
-            logger.error(f"Exception type: {type(e3).__name__}")
-            logger.error(f"Exception details: {str(e3)}")
-            import traceback
-            logger.error(f"Traceback: {traceback.format_exc()}")
-            # Create minimal forms if there's an error
-            self.setting_ui = None
-            self.ai_prompt_ui = None
-        
         # Start data collection
         if self.worker_thread and self.data_worker:
             try:
@@ -192,9 +358,27 @@ class IB_Trading_APP(QMainWindow):
                 logger.info("Data collection thread started successfully")
             except Exception as e3:
                 logger.error(f"Failed to start data collection thread: {e3}")
+        elif self.single_thread and self.data_worker:
+            self.poll_timer = QTimer(self)
+            self.poll_timer.timeout.connect(self.data_worker.poll_once)
+            self.poll_timer.start(int(self.config.data_collection_interval * 1000))
+            QTimer.singleShot(0, self.data_worker.poll_once)
+            logger.info("Data collection running in single-thread mode")
         else:
             logger.warning("Data collection thread not available")
 
+        # AI engine and global hotkeys are not needed for the first paint; start them
+        # once the event loop is running
+        self.ai_engine = None
+        self.hotkey_manager = None
+        QTimer.singleShot(0, self._init_background_subsystems)
+        
+        self.refresh_ui_with_whitespace()
+
+    def _init_background_subsystems(self):
+        """Create the AI engine and hotkey manager after the window has been shown"""
+        if self._shutting_down:
+            return
         try:
             logger.debug("Initializing AI engine...")
             self.ai_engine = AI_Engine(self.config, self.data_worker)
@@ -218,7 +402,6 @@ class IB_Trading_APP(QMainWindow):
                 self.hotkey_manager = HotkeyManager(self.data_worker.collector.trading_manager, parent_window=self)
                 # Provide UI notify hook to trading manager for asynchronous notifications (e.g., chase convert)
                 try:
-                    from PyQt6.QtCore import QTimer
                     def ui_notify(message: str, success: bool):
                         # Ensure this runs on the UI thread
                         def _show():
@@ -243,63 +426,86 @@ class IB_Trading_APP(QMainWindow):
         except Exception as e3:
             logger.error(f"Failed to initialize hotkey manager: {e3}")
             self.hotkey_manager = None
-        
-        self.refresh_ui_with_whitespace()
-        
-        # Ensure setting_ui attribute exists even if initialization failed
-        if not hasattr(self, 'setting_ui'):
-            self.setting_ui = None
-        if not hasattr(self, 'ai_prompt_ui'):
-            self.ai_prompt_ui = None
 
     def setup_ui(self):
         """Setup the user interface"""
         self.setWindowTitle("IB Trading Application")
         
+        # Verify the UI contract once and cache the widgets used on every tick
+        missing = [name for name in _REQUIRED_UI_ATTRS if not hasattr(self.ui, name)]
+        if missing:
+            logger.error(f"Main UI is missing required widgets: {missing}")
+        assert not missing, missing
+        # Bind every label once; queued writes and clears address them by short name
+        self._lbl = SimpleNamespace(**{
+            name[len('label_'):]: widget for name, widget in vars(self.ui).items()
+            if name.startswith('label_')
+        })
+        # Bound setText per label, so queued writes cost one dict lookup and one C call
+        self._setters = {name: widget.setText for name, widget in vars(self._lbl).items()}
+        # The AI panel's text browsers share the queue under the same short names
+        self._setters.update(
+            (name[len('textbrowser_'):], widget.setPlainText) for name, widget in vars(self.ui).items()
+            if name.startswith('textbrowser_')
+        )
+        
         # Set initial connection status
+        self._lbl.connection_status.setStyleSheet(_SS_CONNECTION_STATUS)
         self.update_connection_status({'status': self.connection_status})
         
-        # Initialize time label with current time
-        if hasattr(self.ui, 'label_time'):
-            current_time = datetime.now().strftime("%I:%M:%S %p")
-            self.ui.label_time.setText(current_time)
-        
-        # Connect settings button
-        if hasattr(self.ui, 'pushButton_settings'):
-            try:
-                self.ui.pushButton_settings.clicked.connect(self.show_setting_ui)
-            except Exception as e4:
-                logger.error(f"Error connecting settings button: {e4}")
-        
-        # Connect AI prompt button
-        if hasattr(self.ui, 'button_ai_prompt'):
-            try:
-                self.ui.button_ai_prompt.clicked.connect(self.show_ai_prompt_ui)
-            except Exception as e5:
-                logger.error(f"Error connecting AI prompt button: {e5}")
+        # Initialize time label with current time. The clock is the only polled widget;
+        # everything else is pushed by worker signals. refresh_ui re-arms the single-shot
+        # timer for the next whole second, so the label flips on the boundary without drift
+        self._set_time_text = self._setters['time']
+        self.refresh_timer = QTimer(self)
+        self.refresh_timer.setSingleShot(True)
+        self.refresh_timer.timeout.connect(self.refresh_ui)
+        self.refresh_ui()
         
-        if hasattr(self.ui, 'button_refresh_ai'):
+        # Connect the optional buttons with a single lookup each
+        for name, slot_name in _BUTTON_SLOTS:
+            button = getattr(self.ui, name, None)
+            if button is None:
+                continue
             try:
-                self.ui.button_refresh_ai.clicked.connect(self.refresh_ai)
+                button.clicked.connect(getattr(self, slot_name))
             except Exception as e:
-                logger.error(f"Error connecting refresh AI button: {e}")
-        
-        # Setup refresh timer for UI updates
-        self.refresh_timer = QTimer()
-        self.refresh_timer.timeout.connect(self.refresh_ui)
-        self.refresh_timer.start(1000)  # Update every second
+                logger.error(f"Error connecting {name}: {e}")
         
     def show_setting_ui(self):
         """Show the settings dialog"""
         if self.setting_ui is None:
-            logger.error("Settings UI not available")
-            return
+            try:
+                logger.debug("Initializing Settings_Form...")
+                self.setting_ui = Settings_Form(self.config, self.connection_status, self.data_worker)
+                self._wire_setting_signals()
+                logger.debug("Settings_Form initialized successfully")
+            except Exception as e:
+                logger.error(f"Error initializing Settings_Form: {e}")
+                self.setting_ui = None
+                return
             
         # Reload config values into UI before showing
         if hasattr(self.setting_ui, 'load_config_values'):
             self.setting_ui.load_config_values()
+        # Snapshot the config so an unchanged Save can skip the disk write
+        self._pre_edit_hash = self._config_hash()
         self.setting_ui.exec()
 
+    def _wire_setting_signals(self):
+        """Connect a freshly built settings form to its buttons"""
+        # The form's widget set is fixed after setupUi; resolve the log level combos once
+        self._setting_log_combos = tuple(
+            (module, combo) for module, attr in LOG_LEVEL_COMBOS
+            if (combo := getattr(self.setting_ui.ui, attr, None)) is not None
+        )
+        
+        # Connect form signals
+        if hasattr(self.setting_ui.ui, 'cancelButton'):
+            self.setting_ui.ui.cancelButton.clicked.connect(self._close_setting_form)
+        if hasattr(self.setting_ui.ui, 'saveButton'):
+            self.setting_ui.ui.saveButton.clicked.connect(self._save_setting_form)
+
     def refresh_ai(self):
         """Refresh the AI engine"""
         if hasattr(self, 'ai_engine') and self.ai_engine:
@@ -332,18 +538,16 @@ class IB_Trading_APP(QMainWindow):
         try:
             logger.info("AI analysis ready received")
             
-            # Extract key data
-            price_range = analysis_data.get('valid_price_range', {})
-            analysis_summary = analysis_data.get('analysis_summary', '')
-            confidence_level = analysis_data.get('confidence_level', 0.0)
+            # Extract key data once for logging and all UI formatters
+            analysis = _PreparedAnalysis.from_dict(analysis_data)
 
             # Update UI with analysis results
-            logger.info(f"AI Analysis - Price Range: {format_currency(price_range.get('low', 0))} - {format_currency(price_range.get('high', 0))}")
-            logger.info(f"AI Analysis - Confidence: {confidence_level:.2f}")
-            logger.info(f"AI Analysis - Summary: {analysis_summary[:100]}...")
+            logger.info(f"AI Analysis - Price Range: {format_currency(analysis.low)} - {format_currency(analysis.high)}")
+            logger.info(f"AI Analysis - Confidence: {analysis.confidence:.2f}")
+            logger.info(f"AI Analysis - Summary: {analysis.summary[:100]}...")
             
             # Update AI Insights UI elements
-            self._update_ai_insights_ui(analysis_data)
+            self._update_ai_insights_ui(analysis)
             
             # Store analysis for potential use by trading logic
             self.last_ai_analysis = analysis_data
@@ -351,48 +555,40 @@ class IB_Trading_APP(QMainWindow):
         except Exception as e:
             logger.error(f"Error handling AI analysis: {e}")
     
-    def _update_ai_insights_ui(self, analysis_data: Dict[str, Any]):
+    def _update_ai_insights_ui(self, analysis: '_PreparedAnalysis'):
         """Update the AI insights UI with analysis results"""
         try:
-            # Extract data
-            price_range = analysis_data.get('valid_price_range', {})
-            analysis_summary = analysis_data.get('analysis_summary', '')
-            confidence_level = analysis_data.get('confidence_level', 0.0)
-            key_insights = analysis_data.get('key_insights', [])
-            risk_assessment = analysis_data.get('risk_assessment', '')
-            alerts = analysis_data.get('alerts', [])
-            
             # Determine AI bias based on analysis
-            ai_bias = self._determine_ai_bias(price_range, analysis_summary, key_insights)
+            ai_bias = self._determine_ai_bias(analysis)
+
+            # Same analysis and bias as last time (e.g. a cached response): nothing to redraw
+            sig = analysis.signature(ai_bias)
+            if sig is not None and sig == self._last_analysis_sig:
+                logger.debug("AI insights unchanged, skipping UI update")
+                return
+            self._last_analysis_sig = sig
             
             # Format key levels
-            key_levels = self._format_key_levels(price_range)
+            key_levels = self._format_key_levels(analysis.low, analysis.high)
             
             # Format strategy text
-            strategy_text = self._format_strategy_text(analysis_summary, key_insights, confidence_level)
+            strategy_text = self._format_strategy_text(analysis.summary, analysis.insights, analysis.confidence)
             
             # Format alert text
-            alert_text = self._format_alert_text(risk_assessment, alerts)
-            
-            # Update UI elements
-            if hasattr(self.ui, 'label_ai_bias_value'):
-                self.ui.label_ai_bias_value.setText(ai_bias)
-            
-            if hasattr(self.ui, 'label_ai_keylevel_value'):
-                self.ui.label_ai_keylevel_value.setText(key_levels)
+            alert_text = self._format_alert_text(analysis.risk, analysis.alerts)
             
-            if hasattr(self.ui, 'textbrowser_ai_strategy_value'):
-                self.ui.textbrowser_ai_strategy_value.setPlainText(strategy_text)
-            
-            if hasattr(self.ui, 'textbrowser_ai_alert_value'):
-                self.ui.textbrowser_ai_alert_value.setPlainText(alert_text)
+            # Queue the panel with the other label writes; the flush repaints once
+            self._queue_text('ai_bias_value', ai_bias)
+            self._queue_text('ai_keylevel_value', key_levels)
+            self._queue_text('ai_strategy_value', strategy_text)
+            self._queue_text('ai_alert_value', alert_text)
             
             logger.info("AI insights UI updated successfully")
             
         except Exception as e:
             logger.error(f"Error updating AI insights UI: {e}")
     
-    def _determine_ai_bias(self, price_range: Dict[str, float], analysis_summary: str, key_insights: List[str]) -> str:
+    def _determine_ai_bias(self, analysis: '_PreparedAnalysis') -> str:
         """Determine AI bias (Bullish/Bearish/Neutral) based on analysis"""
         try:
             # Get current price
@@ -401,61 +597,52 @@ class IB_Trading_APP(QMainWindow):
                 current_price = self.data_worker.collector.underlying_symbol_price or 0
             
             if current_price <= 0:
-                return "Neutral"
+                return _BIAS_NEUTRAL
             
-            low_price = price_range.get('low', 0)
-            high_price = price_range.get('high', 0)
+            low_price = analysis.low
+            high_price = analysis.high
             
             if low_price <= 0 or high_price <= 0:
-                return "Neutral"
+                return _BIAS_NEUTRAL
             
             # Calculate price position relative to range
             range_mid = (low_price + high_price) / 2
             range_size = high_price - low_price
             
             if range_size <= 0:
-                return "Neutral"
+                return _BIAS_NEUTRAL
             
             # Determine bias based on current price position and analysis content
             price_position = (current_price - low_price) / range_size
             
-            # Check analysis content for bias indicators
-            summary_lower = analysis_summary.lower()
-            insights_text = ' '.join(key_insights).lower()
-            
-            bullish_indicators = ['bullish', 'bull', 'upward', 'higher', 'support', 'buy', 'long']
-            bearish_indicators = ['bearish', 'bear', 'downward', 'lower', 'resistance', 'sell', 'short']
-            
-            bullish_count = sum(1 for indicator in bullish_indicators if indicator in summary_lower or indicator in insights_text)
-            bearish_count = sum(1 for indicator in bearish_indicators if indicator in summary_lower or indicator in insights_text)
+            # Check analysis content for bias indicators (number of distinct keywords present)
+            bullish_count = len(set(_BULL_RE.findall(analysis.text_lower)))
+            bearish_count = len(set(_BEAR_RE.findall(analysis.text_lower)))
             
             # Combine price position and text analysis
             if price_position > 0.6 and bullish_count > bearish_count:
-                return "Bullish"
+                return _BIAS_BULLISH
             elif price_position < 0.4 and bearish_count > bullish_count:
-                return "Bearish"
+                return _BIAS_BEARISH
             else:
-                return "Neutral"
+                return _BIAS_NEUTRAL
                 
         except Exception as e:
             logger.error(f"Error determining AI bias: {e}")
-            return "Neutral"
+            return _BIAS_NEUTRAL
     
     @staticmethod
-    def _format_key_levels(price_range: Dict[str, float]) -> str:
+    def _format_key_levels(low_price: float, high_price: float) -> str:
         """Format key price levels for display"""
         try:
-            low_price = price_range.get('low', 0)
-            high_price = price_range.get('high', 0)
-            
             if low_price <= 0 or high_price <= 0:
-                return "N/A"
+                return _NA
             
-            return f"{format_currency(low_price)} - {format_currency(high_price)}"
+            return _FMT_KEY_LEVELS(format_currency(low_price), format_currency(high_price))
             
         except Exception as e:
             logger.error(f"Error formatting key levels: {e}")
-            return "N/A"
+            return _NA
     
     @staticmethod
     def _format_strategy_text(analysis_summary: str, key_insights: List[str], confidence_level: float) -> str:
@@ -494,10 +681,7 @@ class IB_Trading_APP(QMainWindow):
                 alert_parts.append(f"Risk Assessment:\n{risk_assessment}")
             
             # Add any high-priority alerts as alerts
-            high_priority_keywords = ['warning', 'caution', 'risk', 'danger', 'alert', 'critical']
             high_priority_alerts = []
-
-
             for alert in alerts:
                 high_priority_alerts.append(f"⚠️ {alert}")
             
@@ -530,16 +714,26 @@ class IB_Trading_APP(QMainWindow):
 
     def show_ai_prompt_ui(self):
         """Show the AI prompt dialog"""
-        if not hasattr(self, 'ai_prompt_ui') or self.ai_prompt_ui is None:
-            logger.error("AI Prompt UI not available - attempting to reinitialize...")
+        if self.ai_prompt_ui is None:
             try:
+                logger.debug("Initializing AIPrompt_Form...")
                 self.ai_prompt_ui = AI_Prompt_Form(self.config, self.refresh_ai)
-                logger.info("AIPrompt_Form reinitialized successfully")
+                logger.debug("AIPrompt_Form initialized successfully")
             except Exception as e:
-                logger.error(f"Failed to reinitialize AIPrompt_Form: {e}")
+                logger.error(f"Failed to initialize AIPrompt_Form: {e}")
                 return
         self.ai_prompt_ui.exec()
 
+    def _refresh_config_cache(self):
+        """Cache config values read on every tick; call whenever self.config changes"""
+        trading = self.config.trading if self.config else None
+        self._underlying_symbol = trading.get('underlying_symbol') if trading else None
+
+    def _config_hash(self, config: Optional[AppConfig] = None) -> int:
+        """Hash the configuration contents (the current config by default) for change detection"""
+        config = config or self.config
+        return hash(json.dumps(config.to_dict(), sort_keys=True, default=str))
+
     def _close_setting_form(self):
         if hasattr(self, 'setting_ui') and self.setting_ui:
             self.setting_ui.close()
@@ -555,39 +749,35 @@ class IB_Trading_APP(QMainWindow):
                 logger.error("Configuration not available")
                 return
                 
-            # Get connection settings
-            self.config.connection.update({
-                "host": self.setting_ui.ui.hostEdit.text(),
-                "port": int(self.setting_ui.ui.portEdit.text()),
-                "client_id": int(self.setting_ui.ui.clientIdEdit.text())
-            })
-            
-            # Get trading settings
-            self.config.trading.update({
-                "underlying_symbol": self.setting_ui.ui.underlyingSymbolEdit.text(),
-                "trade_delta": float(self.setting_ui.ui.tradeDeltaEdit.text()),
-                "max_trade_value": float(self.setting_ui.ui.maxTradeValueEdit.text()),
-                "runner": int(self.setting_ui.ui.runnerEdit.text())
-            })
-            
-            # Get risk levels from table
-            risk_levels = []
+            # Get connection and trading settings from the text fields
+            # Parse every field before touching self.config so a bad value leaves it intact
+            ui = self.setting_ui.ui
+            new_values = []
+            errors = []
+            for section, key, widget, cast in self._SETTING_SCHEMA:
+                try:
+                    new_values.append((section, key, cast(getattr(ui, widget).text())))
+                except ValueError as e:
+                    errors.append(f"'{widget}': {e}")
+            if errors:
+                raise ValueError("Invalid value in " + "; ".join(errors))
+            for section, key, value in new_values:
+                getattr(self.config, section)[key] = value
+            
+            # Get risk levels from table in a single pass, dropping rows with no values
             table = self.setting_ui.ui.riskLevelsTable
-            for row in range(table.rowCount()):
-                risk_level = {}
-                # Check if cells exist and have text
-                loss_threshold_item = table.item(row, 0)
-                account_trade_limit_item = table.item(row, 1)
-                stop_loss_item = table.item(row, 2)
-                profit_gain_item = table.item(row, 3)
-                
-                risk_level["loss_threshold"] = loss_threshold_item.text() if loss_threshold_item and loss_threshold_item.text() != "-" else ""
-                risk_level["account_trade_limit"] = account_trade_limit_item.text() if account_trade_limit_item and account_trade_limit_item.text() != "-" else ""
-                risk_level["stop_loss"] = stop_loss_item.text() if stop_loss_item and stop_loss_item.text() != "-" else ""
-                risk_level["profit_gain"] = profit_gain_item.text() if profit_gain_item and profit_gain_item.text() != "-" else ""
-                
-                risk_levels.append(risk_level)
-            
+            item = table.item
+            columns = range(len(self._RISK_LEVEL_KEYS))
+            cells = [[item(r, c) for c in columns] for r in range(table.rowCount())]
+            rows = [
+                [("" if it is None or (text := it.text()) == "-" else text) for it in row]
+                for row in cells
+            ]
+            risk_levels = [dict(zip(self._RISK_LEVEL_KEYS, row)) for row in rows if any(row)]
+            
+            # The trading values just parsed are exactly what the data worker needs
+            trading_update = {key: value for section, key, value in new_values if section == 'trading'}
+            trading_update["risk_levels"] = risk_levels
             self.config.trading["risk_levels"] = risk_levels
             
             # Get debug settings
@@ -597,42 +787,31 @@ class IB_Trading_APP(QMainWindow):
             
             # Get module log levels
             module_levels = {}
-            if hasattr(self.setting_ui.ui, 'mainLogLevelCombo'):
-                module_levels["MAIN"] = self.setting_ui.ui.mainLogLevelCombo.currentText()
-            if hasattr(self.setting_ui.ui, 'guiLogLevelCombo'):
-                module_levels["GUI"] = self.setting_ui.ui.guiLogLevelCombo.currentText()
-            if hasattr(self.setting_ui.ui, 'ibConnectionLogLevelCombo'):
-                module_levels["IB_CONNECTION"] = self.setting_ui.ui.ibConnectionLogLevelCombo.currentText()
-            if hasattr(self.setting_ui.ui, 'dataCollectorLogLevelCombo'):
-                module_levels["DATA_COLLECTOR"] = self.setting_ui.ui.dataCollectorLogLevelCombo.currentText()
-            if hasattr(self.setting_ui.ui, 'configManagerLogLevelCombo'):
-                module_levels["CONFIG_MANAGER"] = self.setting_ui.ui.configManagerLogLevelCombo.currentText()
-            if hasattr(self.setting_ui.ui, 'aiEngineLogLevelCombo'):
-                module_levels["AI_ENGINE"] = self.setting_ui.ui.aiEngineLogLevelCombo.currentText()
+            for module, combo in self._setting_log_combos:
+                module_levels[module] = combo.currentText()
 
             self.config.debug["modules"].update(module_levels)
             
-            # Save to file
-            self.config.save_to_file()
+            # Nothing changed since the dialog was opened: close without touching disk
+            if self._config_hash() == getattr(self, '_pre_edit_hash', None):
+                logger.info("Settings unchanged, skipping save")
+                self.setting_ui.close()
+                return
+            
+            # Save to file in the background
+            self._saver.request_save(self.config)
             
             # Update data worker with new trading configuration
             if hasattr(self, 'data_worker') and self.data_worker:
                 try:
-                    # Get the updated trading configuration
-                    updated_trading_config = {
-                        "underlying_symbol": self.config.trading.get("underlying_symbol"),
-                        "trade_delta": self.config.trading.get("trade_delta"),
-                        "max_trade_value": self.config.trading.get("max_trade_value"),
-                        "runner": self.config.trading.get("runner"),
-                        "risk_levels": self.config.trading.get("risk_levels", [])
-                    }
-                    
                     # Update the data worker's trading configuration
-                    self.data_worker.update_trading_config(updated_trading_config)
+                    self.data_worker.update_trading_config(trading_update)
                     logger.info("Data worker trading configuration updated")
                 except Exception as e:
                     logger.error(f"Error updating data worker trading configuration: {e}")
             
+            self._refresh_config_cache()
+            
             # Close the settings dialog
             self.setting_ui.close()
             
@@ -651,51 +830,21 @@ class IB_Trading_APP(QMainWindow):
         
     def refresh_ui_with_whitespace(self):
         """Refresh UI with whitespace"""
-        self.ui.label_spy_name.setText(f"---")
-        self.ui.label_spy_value.setText(f"---")
-        self.ui.label_usd_cad_value.setText(f"---")
-        self.ui.label_cad_usd_value.setText(f"---")
-        self.ui.label_account_value_value.setText(f"---")
-        self.ui.label_symbol_value.setText(f"---")
-        self.ui.label_quantity_value.setText(f"---")
-        self.ui.label_pl_dollar_value.setText(f"---")
-        self.ui.label_pl_percent_value.setText(f"---")
-        
-        # Clear option information fields
-        self.ui.label_strike_value.setText(f"---")
-        self.ui.label_expiration_value.setText(f"---")
-        self.ui.label_call_price_value.setText(f"---")
-        self.ui.label_call_bid_value.setText(f"---")
-        self.ui.label_call_ask_value.setText(f"---")
-        self.ui.label_call_delta_value.setText(f"---")
-        self.ui.label_call_gamma_value.setText(f"---")
-        self.ui.label_call_theta_value.setText(f"---")
-        self.ui.label_call_vega_value.setText(f"---")
-        self.ui.label_call_openint_value.setText(f"---")
-        self.ui.label_call_volume_value.setText(f"---")
-        self.ui.label_put_price_value.setText(f"---")
-        self.ui.label_put_bid_value.setText(f"---")
-        self.ui.label_put_ask_value.setText(f"---")
-        self.ui.label_put_delta_value.setText(f"---")
-        self.ui.label_put_gamma_value.setText(f"---")
-        self.ui.label_put_theta_value.setText(f"---")
-        self.ui.label_put_vega_value.setText(f"---")
-        self.ui.label_put_openint_value.setText(f"---")
-        self.ui.label_put_volume_value.setText(f"---")
-        self.ui.label_account_value_value.setText(f"---")
-        self.ui.label_starting_value_value.setText(f"---")
-        self.ui.label_high_water_value.setText(f"---")
-        self.ui.label_daily_pl_value.setText(f"---")
-        self.ui.label_daily_pl_percent_value.setText(f"---")
-        
-        
-        self.ui.label_win_rate_value.setText(f"---")
-        self.ui.label_total_trades_value.setText(f"---")
-        self.ui.label_total_wins_count_value.setText(f"---")
-        self.ui.label_total_losses_count_value.setText(f"---")
-        self.ui.label_total_losses_sum_value.setText(f"---")
-        self.ui.label_total_trades_value.setText(f"---")
-        self.ui.label_total_wins_sum_value.setText(f"---")
+        self._clear_labels(self._WHITESPACE_LABELS)
+        self._fx_cache = (None, None, None)
+        self._acct_cache = None
+
+    def _clear_labels(self, names, texts: Optional[Dict[str, str]] = None):
+        """Reset the given labels to the placeholder text with a single repaint.
+
+        texts maps further label names to values written in the same batch.
+        """
+        shown = self._shown
+        items = [(name, _DASH) for name in names if shown.get(name) != _DASH]
+        if texts:
+            items.extend((name, text) for name, text in texts.items() if shown.get(name) != text)
+        if items:
+            self._write_labels(items)
 
     def refresh_main_gui_with_config(self):
         """Refresh the main GUI with current configuration values"""
@@ -703,39 +852,15 @@ class IB_Trading_APP(QMainWindow):
             logger.info("Refreshing main GUI with updated configuration")
             
             # Update underlying symbol display
+            texts = None
             if hasattr(self, 'config') and self.config and self.config.trading:
-                underlying_symbol = self.config.trading.get('underlying_symbol', '---')
-                self.ui.label_spy_name.setText(f"{underlying_symbol}")
+                underlying_symbol = self.config.trading.get('underlying_symbol', _DASH)
+                texts = {'spy_name': str(underlying_symbol)}
                 logger.info(f"Updated underlying symbol display to: {underlying_symbol}")
             
-            # Clear other values that might be affected by symbol change
-            self.ui.label_spy_value.setText(f"---")
-            self.ui.label_symbol_value.setText(f"---")
-            self.ui.label_quantity_value.setText(f"---")
-            self.ui.label_pl_dollar_value.setText(f"---")
-            self.ui.label_pl_percent_value.setText(f"---")
-            
-            # Clear option information fields that are affected by symbol change
-            self.ui.label_strike_value.setText(f"---")
-            self.ui.label_expiration_value.setText(f"---")
-            self.ui.label_call_price_value.setText(f"---")
-            self.ui.label_call_bid_value.setText(f"---")
-            self.ui.label_call_ask_value.setText(f"---")
-            self.ui.label_call_delta_value.setText(f"---")
-            self.ui.label_call_gamma_value.setText(f"---")
-            self.ui.label_call_theta_value.setText(f"---")
-            self.ui.label_call_vega_value.setText(f"---")
-            self.ui.label_call_openint_value.setText(f"---")
-            self.ui.label_call_volume_value.setText(f"---")
-            self.ui.label_put_price_value.setText(f"---")
-            self.ui.label_put_bid_value.setText(f"---")
-            self.ui.label_put_ask_value.setText(f"---")
-            self.ui.label_put_delta_value.setText(f"---")
-            self.ui.label_put_gamma_value.setText(f"---")
-            self.ui.label_put_theta_value.setText(f"---")
-            self.ui.label_put_vega_value.setText(f"---")
-            self.ui.label_put_openint_value.setText(f"---")
-            self.ui.label_put_volume_value.setText(f"---")
+            # Clear other values that might be affected by symbol change, in the same repaint
+            self._invalidate_payload_cache()
+            self._clear_labels(self._SYMBOL_LABELS + self._OPTION_LABELS, texts)
                         
             logger.info("Main GUI refreshed successfully")
             
@@ -748,22 +873,14 @@ class IB_Trading_APP(QMainWindow):
             logger.info(f"Trading configuration update received: {config_data}")
             
             # Extract new values
-            underlying_symbol = config_data.get('underlying_symbol', '---')
+            underlying_symbol = config_data.get('underlying_symbol', _DASH)
             new_cfg = config_data.get('trading_config', {}) or {}
+            self._underlying_symbol = config_data.get('underlying_symbol', self._underlying_symbol)
             
-            # Update the underlying symbol display
-            self.ui.label_spy_name.setText(f"{underlying_symbol}")
-            
-            # Clear values that are affected by symbol change
-            self.ui.label_spy_value.setText(f"---")
-            self.ui.label_symbol_value.setText(f"---")
-            self.ui.label_quantity_value.setText(f"---")
-            self.ui.label_pl_dollar_value.setText(f"---")
-            self.ui.label_pl_percent_value.setText(f"---")
-            
-            # Clear option information fields that are affected by symbol change
-            self.ui.label_strike_value.setText(f"---")
-            self.ui.label_expiration_value.setText(f"---")
+            # Update the underlying symbol display and clear the values affected by the
+            # symbol change in one repaint
+            self._invalidate_payload_cache()
+            self._clear_labels(self._SYMBOL_LABELS, {'spy_name': str(underlying_symbol)})
             
             # Detect if ONLY the underlying symbol changed compared to our last snapshot
             try:
@@ -798,8 +915,14 @@ class IB_Trading_APP(QMainWindow):
         try:
             logger.info("Reloading configuration from file")
             
-            # Reload configuration from file
-            self.config = AppConfig.load_from_file()
+            # Reload configuration from file; when its contents match the config in use
+            # there is nothing to push or repaint
+            config = AppConfig.load_from_file()
+            if self._config_hash(config) == self._config_hash():
+                logger.info("Configuration file unchanged, skipping reload")
+                return
+            self.config = config
+            self._refresh_config_cache()
             
             # Update data worker with new configuration
             if hasattr(self, 'data_worker') and self.data_worker:
@@ -819,16 +942,9 @@ class IB_Trading_APP(QMainWindow):
 
     def update_calls_option(self, calls_data: Dict[str, Any]):
         try:
-            # print(f"UI Calls Data: {calls_data}")
-            self.ui.label_call_price_value.setText(f'{calls_data.get("Last")}')
-            self.ui.label_call_bid_value.setText(f'{calls_data.get("Bid")}')
-            self.ui.label_call_ask_value.setText(f'{calls_data.get("Ask")}')
-            self.ui.label_call_delta_value.setText(f'{calls_data.get("Delta"):.4f}')
-            self.ui.label_call_gamma_value.setText(f'{calls_data.get("Gamma"):.4f}')
-            self.ui.label_call_theta_value.setText(f'{calls_data.get("Theta"):.4f}')
-            self.ui.label_call_vega_value.setText(f'{calls_data.get("Vega"):.4f}')
-            self.ui.label_call_openint_value.setText(f'{calls_data.get("Call_Open_Interest")}')
-            self.ui.label_call_volume_value.setText(f'{calls_data.get("Volume")}')
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("UI Calls Data: %s", calls_data)
+            self._apply_map(self._CALLS_MAP, calls_data)
 
         except Exception as e:
             logger.error(f"Error updating UI with calls option data: {e}")
@@ -836,49 +952,61 @@ class IB_Trading_APP(QMainWindow):
 
     def update_puts_option(self, puts_data: Dict[str, Any]):
         try:
-            # print(f"UI Puts Data: {puts_data}")
-            self.ui.label_put_price_value.setText(f'{puts_data.get("Last")}')
-            self.ui.label_put_bid_value.setText(f'{puts_data.get("Bid")}')
-            self.ui.label_put_ask_value.setText(f'{puts_data.get("Ask")}')
-            self.ui.label_put_delta_value.setText(f'{puts_data.get("Delta"):.4f}')
-            self.ui.label_put_gamma_value.setText(f'{puts_data.get("Gamma"):.4f}')
-            self.ui.label_put_theta_value.setText(f'{puts_data.get("Theta"):.4f}')
-            self.ui.label_put_vega_value.setText(f'{puts_data.get("Vega"):.4f}')
-            self.ui.label_put_openint_value.setText(f'{puts_data.get("Put_Open_Interest")}')
-            self.ui.label_put_volume_value.setText(f'{puts_data.get("Volume")}')
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("UI Puts Data: %s", puts_data)
+            self._apply_map(self._PUTS_MAP, puts_data)
 
         except Exception as e:
             logger.error(f"Error updating UI with puts option data: {e}")
 
+    def _apply_map(self, mapping, data: Dict[str, Any]):
+        """Queue label writes for every (label, key, formatter) entry of mapping"""
+        # A missing value (e.g. a Greek IB has not computed yet) shows as a placeholder
+        # instead of failing the whole panel update
+        texts = [
+            (name, _DASH if (value := data.get(key)) is None else fmt(value))
+            for name, key, fmt in mapping
+        ]
+        for name, text in texts:
+            self._queue_text(name, text)
+
     def update_ui_with_data(self, data: Dict[str, Any]):
         """Update UI with collected data"""
+        now = time.monotonic()
+        if now - self._last_ui_update < self._min_ui_interval:
+            # Too soon after the last update: keep only the latest payload and apply it when the interval ends
+            self._pending_data = data
+            if not self._pending_data_timer.isActive():
+                remaining = self._min_ui_interval - (now - self._last_ui_update)
+                self._pending_data_timer.start(max(1, int(remaining * 1000) + 1))
+            return
+        self._last_ui_update = now
+        self._pending_data = None
         try:
-            if hasattr(self, 'config') and self.config and self.config.trading and self.config.trading.get('underlying_symbol') is not None:
-                self.ui.label_spy_name.setText(f"{self.config.trading.get('underlying_symbol')}")
+            if self._underlying_symbol is not None:
+                self._queue_text('spy_name', f"{self._underlying_symbol}")
             else:
-                self.ui.label_spy_name.setText(f"---")
+                self._queue_text('spy_name', _DASH)
 
             # Update SPY price
             if data.get('underlying_symbol_price') is not None and data['underlying_symbol_price'] > 0:
-                self.ui.label_spy_value.setText(format_currency(data['underlying_symbol_price']))
+                self._queue_text('spy_value', format_currency(data['underlying_symbol_price']))
 
             if data.get('fx_ratio') is not None and data['fx_ratio'] > 0:
-                self.ui.label_usd_cad_value.setText(f"{data['fx_ratio']:.4f}")
-                self.ui.label_cad_usd_value.setText(f"{1/data['fx_ratio']:.4f}")
+                self._set_fx_rate(data['fx_ratio'])
 
 
-            # Update account metrics
-            if data.get('account') is not None and not data['account'].empty:
-                logger.info("Updating Account Data in UI")
-                account_data = data['account'].iloc[0]
+            # Update account metrics (skipped when the values are unchanged)
+            account_data = data.get('account')
+            if account_data:
                 account_value = account_data.get('NetLiquidation', 'N/A')
-                starting_value = account_data.get('StartingValue','---')
-                high_water_mark = account_data.get('HighWaterMark', '---')
+                starting_value = account_data.get('StartingValue', _DASH)
+                high_water_mark = account_data.get('HighWaterMark', _DASH)
 
-                self.ui.label_account_value_value.setText(format_currency(account_value))
-                self.ui.label_starting_value_value.setText(format_currency(starting_value))
-                self.ui.label_high_water_value.setText(format_currency(high_water_mark))
-                logger.info(f"Account Net Liquidation: {format_currency(account_value)}")
+                if self._set_account_values(account_value, starting_value, high_water_mark) and \
+                        logger.isEnabledFor(logging.INFO):
+                    logger.info("Updating Account Data in UI")
+                    logger.info("Account Net Liquidation: %s", format_currency(account_value))
                 # Update account-related UI elements here
             #
 
@@ -889,56 +1017,99 @@ class IB_Trading_APP(QMainWindow):
             #     logger.info(f"Active positions: {positions_count}")
             
             # Update active contract data
-            if data.get('active_contract') is not None and not data['active_contract'].empty:
-                logger.info("Updating Active Contract Data in UI")
-                active_contract_data = data['active_contract'].iloc[0]
-                logger.info(f"Active contract data: {active_contract_data}")
+            active_contract_data = data.get('active_contract')
+            if active_contract_data and \
+                    self._payload_changed('_active_contract_hash', active_contract_data):
+                if logger.isEnabledFor(logging.INFO):
+                    logger.info("Updating Active Contract Data in UI")
+                    # Series repr is expensive; only build it when INFO is on
+                    logger.info("Active contract data: %s", active_contract_data)
                 if active_contract_data['position_size'] == 0:
-                    self.ui.label_symbol_value.setText(f"---")
-                    self.ui.label_quantity_value.setText(f"---")
-                    self.ui.label_pl_dollar_value.setText(f"---")
-                    self.ui.label_pl_percent_value.setText(f"---")
+                    self._queue_text('symbol_value', _DASH)
+                    self._queue_text('quantity_value', _DASH)
+                    self._queue_text('pl_dollar_value', _DASH)
+                    self._queue_text('pl_percent_value', _DASH)
                 else: 
-                    self.ui.label_symbol_value.setText(f"{active_contract_data.get('symbol', '---')}")
-                    self.ui.label_quantity_value.setText(f"{active_contract_data.get('position_size', '---')}")
+                    self._queue_text('symbol_value', _FMT_RAW(active_contract_data.get('symbol', _DASH)))
+                    self._queue_text('quantity_value', _FMT_RAW(active_contract_data.get('position_size', _DASH)))
                     if active_contract_data["pnl_dollar"] == 0 and active_contract_data["pnl_percent"] == -1:
                         logger.info("Marketplace is close and can't calculate the PNL")
-                        self.ui.label_pl_dollar_value.setText(f"---")
-                        self.ui.label_pl_percent_value.setText(f"---")
+                        self._queue_text('pl_dollar_value', _DASH)
+                        self._queue_text('pl_percent_value', _DASH)
                     else:
-                        self.ui.label_pl_dollar_value.setText(format_currency(active_contract_data.get('pnl_dollar', 0)))
-                        self.ui.label_pl_percent_value.setText(f"{active_contract_data.get('pnl_percent', '---')}%")
+                        self._queue_text('pl_dollar_value', format_currency(active_contract_data.get('pnl_dollar', 0)))
+                        self._queue_text('pl_percent_value', _FMT_PCT(active_contract_data.get('pnl_percent', _DASH)))
 
 
             # Update option information data
-            if data.get('options') is not None and not data['options'].empty:
-                logger.info(f"Updating Option Information Data in UI: {data['options']}")
-
-                option_primary_data = data['options']
-                tmp_expiration = option_primary_data["Expiration"][0]
-                # Convert string format "20250810" to datetime then format as "2025-08-10"
-                if isinstance(tmp_expiration, str) and len(tmp_expiration) == 8:
-                    tmp_expiration = datetime.strptime(tmp_expiration, "%Y%m%d").strftime("%Y-%m-%d")
+            option_primary_data = data.get('options')
+            if option_primary_data and self._payload_changed('_options_hash', option_primary_data):
+                if logger.isEnabledFor(logging.INFO):
+                    logger.info("Updating Option Information Data in UI: %s", option_primary_data)
 
-                self.ui.label_strike_value.setText(f'{option_primary_data["Strike"][0]}')
-                self.ui.label_expiration_value.setText(f'{tmp_expiration}')
+                self._queue_text('strike_value', f'{option_primary_data["Strike"]}')
+                self._queue_text('expiration_value', _fmt_expiration(option_primary_data["Expiration"]))
 
             # Update statistics
-            statistics = data.get('statistics')
-            if statistics is not None and not statistics.empty:
-                stats = statistics.iloc[0]
+            stats = data.get('statistics')
+            if stats and self._payload_changed('_statistics_hash', stats):
                 win_rate = stats.get('Win_Rate', 0)
-                self.ui.label_win_rate_value.setText(f"{win_rate:.2f}%")
-                self.ui.label_total_trades_value.setText(f"{stats.get('Total_Trades', 0)}")
-                self.ui.label_total_wins_count_value.setText(f"{stats.get('Total_Wins_Count', 0)}")
-                self.ui.label_total_losses_count_value.setText(f"{stats.get('Total_Losses_Count', 0)}")
-                self.ui.label_total_losses_sum_value.setText(f"-${stats.get('Total_Losses_Sum', 0):.2f}")
-                self.ui.label_total_wins_sum_value.setText(f"${stats.get('Total_Wins_Sum', 0):.2f}")
-                logger.info(f"Win rate: {win_rate:.2f}%")
+                self._queue_text('win_rate_value', _FMT_RATE(win_rate))
+                self._apply_map(self._STATS_MAP, stats)
+                if logger.isEnabledFor(logging.INFO):
+                    logger.info("Win rate: %.2f%%", win_rate)
                 
         except Exception as e:
             logger.error(f"Error updating UI with data: {e}")
     
+    def _invalidate_payload_cache(self):
+        """Forget payload fingerprints so the next snapshot repopulates cleared labels"""
+        self._active_contract_hash = None
+        self._options_hash = None
+        self._statistics_hash = None
+        self._fx_cache = (None, None, None)
+        self._acct_cache = None
+        # Queued AI panel writes are dropped below too; let the next analysis redraw it
+        self._last_analysis_sig = None
+        # Queued writes belong to the old state and must not overwrite the cleared labels
+        self._pending.clear()
+
+    def _queue_text(self, name: str, text: str):
+        """Queue a label text write for the next UI flush"""
+        self._pending[name] = text
+        if not self._flush_timer.isActive():
+            self._flush_timer.start()
+
+    def _flush_ui(self):
+        """Write all queued label texts to their widgets"""
+        pending, self._pending = self._pending, {}
+        shown = self._shown
+        changed = [(name, text) for name, text in pending.items() if shown.get(name) != text]
+        if not changed:
+            return
+        self._write_labels(changed)
+
+    def _write_labels(self, items):
+        """Write (label name, text) pairs under one repaint and remember what is shown"""
+        setters = self._setters
+        shown = self._shown
+        # Suspend painting so the whole batch produces a single repaint
+        self.setUpdatesEnabled(False)
+        try:
+            for name, text in items:
+                setters[name](text)
+                shown[name] = text
+        finally:
+            self.setUpdatesEnabled(True)
+
+    def _payload_changed(self, attr: str, row: Dict[str, Any]) -> bool:
+        """Return True if row differs from the last snapshot stored under attr"""
+        h = row_hash(row)
+        if h is not None and h == getattr(self, attr):
+            return False
+        setattr(self, attr, h)
+        return True
+
     def update_connection_status(self, data: Union[Dict[str, Any], bool]):
         """Update connection status in UI"""
         # Handle both boolean and dictionary inputs
@@ -948,55 +1119,85 @@ class IB_Trading_APP(QMainWindow):
         else:
             # Dictionary input from connection_success/connection_disconnected signals
             status = data.get('status', 'Unknown')
+            message = data.get('message', '')
+            if message and self.setting_ui is not None:
+                self.setting_ui.log_connection_event(message, "Info")
+        
+        # The settings form may be showing "Error" while the main status is unchanged
+        self._sync_settings_connection_status(status)
+        
+        # connection_status_changed, connection_success and connection_disconnected
+        # usually report the same transition; restyling is costly, so apply it once
+        if status == self._last_conn_status:
+            return
+        self._last_conn_status = status
         
         status_text = f"Connections Status: {status}"
-        status_color = "green" if status == 'Connected' else "red"
         self.connection_status = status
         
-        # Update status label if it exists in the UI
-        if hasattr(self.ui, 'label_connection_status'):
-            self.ui.label_connection_status.setText(status_text)
-            self.ui.label_connection_status.setStyleSheet(f"color: {status_color}")
-            
-        if hasattr(self, 'setting_ui') and self.setting_ui and hasattr(self.setting_ui.ui, 'connectionStatusLabel'):
-            try:
-                self.setting_ui.ui.connectionStatusLabel.setText("Connection: " + self.connection_status)
-                if self.connection_status == 'Connected':
-                    self.setting_ui.ui.connectionStatusLabel.setStyleSheet("color: green;")
-                    self.setting_ui.ui.connectButton.setText("Disconnect")
-                else:
-                    self.setting_ui.ui.connectionStatusLabel.setStyleSheet("color: red;")
-                    self.setting_ui.ui.connectButton.setText("Connect")
-            except Exception as e:
-                logger.error(f"Error updating setting UI connection status: {e}")
-
+        # Update status label; the colour only flips on connect/disconnect, and
+        # re-polishing is far costlier than a text change, so skip it otherwise
+        label = self._lbl.connection_status
+        connected = status == 'Connected'
+        self.setUpdatesEnabled(False)
+        try:
+            label.setText(status_text)
+            if connected is not self._conn_connected:
+                self._conn_connected = connected
+                label.setProperty("connected", connected)
+                style = label.style()
+                style.unpolish(label)
+                style.polish(label)
+        finally:
+            self.setUpdatesEnabled(True)
         
         logger.info(f"Connection status: {status_text}")
     
+    def _sync_settings_connection_status(self, status: str):
+        """Forward a connection status to the settings form unless it already shows it"""
+        if self.setting_ui is None or self.setting_ui.connection_status == status:
+            return
+        try:
+            self.setting_ui.update_connection_status(status)
+        except Exception as e:
+            logger.error(f"Error updating setting UI connection status: {e}")
+    
     def handle_error(self, error_message: str):
         """Handle errors from data collection"""
         logger.error(f"Data collection error: {error_message}")
         
-        # Show error dialog for critical errors
-        if "connection" in error_message.lower() or "timeout" in error_message.lower():
-            QMessageBox.warning(
-                self,
-                "Connection Error",
-                f"Connection issue detected: {error_message}\nPlease check your IB Gateway/TWS connection."
-            )
+        if self.setting_ui is not None:
+            self._sync_settings_connection_status("Error")
+            self.setting_ui.log_connection_event(error_message, "Error")
+        
+        # Surface connection errors without blocking the event loop; the modal dialog is
+        # shown at most once per ERROR_POPUP_INTERVAL and the status bar covers the rest
+        message_lower = error_message.lower()
+        if "connection" in message_lower or "timeout" in message_lower:
+            self.statusBar().showMessage(f"Connection issue: {error_message}", 10000)
+            now = time.monotonic()
+            if now - self._last_error_popup > self.ERROR_POPUP_INTERVAL:
+                self._last_error_popup = now
+                QTimer.singleShot(0, lambda: QMessageBox.warning(
+                    self,
+                    "Connection Error",
+                    f"Connection issue detected: {error_message}\nPlease check your IB Gateway/TWS connection."
+                ))
     
     def update_real_time_price(self, price_data: Dict[str, Any]):
         """Handle real-time price updates from IB"""
         try:
-            symbol = price_data.get('symbol', 'Unknown')
-            price = price_data.get('price', 0)
-            timestamp = price_data.get('timestamp', '')
+            get = price_data.get
+            symbol = get('symbol', 'Unknown')
+            price = get('price', 0)
+            timestamp = get('timestamp', '')
             
-            logger.info(f"Real-time price update: {symbol} = {format_currency(price)} at {timestamp}")
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("Real-time price update: %s = %s at %s", symbol, format_currency(price), timestamp)
             
             # Update the underlying symbol price in UI
-            if hasattr(self, 'config') and self.config and self.config.trading and symbol == self.config.trading.get('underlying_symbol'):
-                self.ui.label_spy_value.setText(format_currency(price))
+            if symbol == self._underlying_symbol:
+                self._queue_text('spy_value', format_currency(price))
                 
                 # Check if price-triggered AI analysis should be performed
                 if (hasattr(self, 'ai_engine') and self.ai_engine and 
@@ -1009,19 +1210,23 @@ class IB_Trading_APP(QMainWindow):
     def _check_price_triggered_analysis(self, current_price: float):
         """Check if price movement warrants AI analysis"""
         try:
-            if not hasattr(self, 'last_ai_analysis') or not self.last_ai_analysis:
+            last_analysis = getattr(self, 'last_ai_analysis', None)
+            if not last_analysis:
                 return
             
-            price_range = self.last_ai_analysis.get('valid_price_range', {})
+            price_range = last_analysis.get('valid_price_range') or {}
             low = price_range.get('low', 0)
             high = price_range.get('high', float('inf'))
             
             # If price is outside the valid range, trigger analysis
             if current_price < low or current_price > high:
-                logger.info(f"Price {format_currency(current_price)} outside AI range [{format_currency(low)}, {format_currency(high)}] - triggering analysis")
+                if logger.isEnabledFor(logging.INFO):
+                    logger.info("Price %s outside AI range [%s, %s] - triggering analysis",
+                                format_currency(current_price), format_currency(low), format_currency(high))
                 if self.ai_engine:
-                    import asyncio
-                    asyncio.create_task(self.ai_engine.analyze_market_data())
+                    # The GUI thread has no running asyncio loop; the engine runs the
+                    # coroutine on its worker pool and ignores triggers while busy
+                    self.ai_engine.trigger_analysis("Price-triggered analysis")
                     
         except Exception as e:
             logger.error(f"Error checking price-triggered analysis: {e}")
@@ -1029,81 +1234,109 @@ class IB_Trading_APP(QMainWindow):
     def update_fx_rate(self, fx_rate_data: Dict[str, Any]):
         """Handle real-time FX rate updates from IB"""
         try:
-            symbol = fx_rate_data.get('symbol', 'Unknown')
-            rate = fx_rate_data.get('rate', 0)
-            timestamp = fx_rate_data.get('timestamp', '')
+            get = fx_rate_data.get
+            symbol = get('symbol', 'Unknown')
+            rate = get('rate', 0)
+            timestamp = get('timestamp', '')
 
-            logger.info(f"Real-time FX rate update: {symbol} = {rate} at {timestamp}")
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("Real-time FX rate update: %s = %s at %s", symbol, rate, timestamp)
 
             # Update the FX rate in UI
             if symbol == 'USDCAD':
-                self.ui.label_usd_cad_value.setText(f"{rate:.4f}")
-                self.ui.label_cad_usd_value.setText(f"{1/rate:.4f}")
+                self._set_fx_rate(rate)
         except Exception as e:
             logger.error(f"Error updating FX rate: {e}")
 
+    def _set_fx_rate(self, rate: float):
+        """Show the USD/CAD rate and its inverse, skipping repeats of the last rate"""
+        if rate == self._fx_cache[0]:
+            return
+        usd_cad, cad_usd = _FMT_FX(rate), _FMT_FX(1.0 / rate)
+        self._fx_cache = (rate, usd_cad, cad_usd)
+        self._queue_text('usd_cad_value', usd_cad)
+        self._queue_text('cad_usd_value', cad_usd)
+
     def update_daily_pnl_updated(self, daily_pnl_data: Dict[str, Any]):
         try:
             # logger.info(f"Updating daily PNL update: {daily_pnl_data}")
             daily_pnl_price = daily_pnl_data.get('daily_pnl_price', 0)
             daily_pnl_percent = daily_pnl_data.get('daily_pnl_percent', 0)
-            self.ui.label_daily_pl_value.setText(format_currency(daily_pnl_price))
-            self.ui.label_daily_pl_percent_value.setText(f"{daily_pnl_percent:.4f}%")
-            logger.info(f"GUI updated Daily pnl price : {daily_pnl_price}   Percent: {daily_pnl_percent}%")
+            self._queue_text('daily_pl_value', format_currency(daily_pnl_price))
+            self._queue_text('daily_pl_percent_value', f"{daily_pnl_percent:.4f}%")
+            logger.info("GUI updated Daily pnl price : %s   Percent: %s%%", daily_pnl_price, daily_pnl_percent)
 
         except Exception as e:
             logger.error(f"Error updating Daily Pnl rate: {e}")
 
     def update_account_summary(self, account_summary: Dict[str, Any]):
         try:
-            self.ui.label_account_value_value.setText(format_currency(account_summary['NetLiquidation']))
-            self.ui.label_starting_value_value.setText(format_currency(account_summary['StartingValue']))
-            self.ui.label_high_water_value.setText(format_currency(account_summary['HighWaterMark']))
+            self._set_account_values(
+                account_summary['NetLiquidation'],
+                account_summary['StartingValue'],
+                account_summary['HighWaterMark'],
+            )
 
         except Exception as e:
             logger.error(f"Error updating Daily Pnl rate: {e}")
+
+    def _set_account_values(self, account_value, starting_value, high_water_mark) -> bool:
+        """Queue the account value labels; return False without formatting if they are unchanged"""
+        key = (account_value, starting_value, high_water_mark)
+        if key == self._acct_cache:
+            return False
+        self._acct_cache = key
+        self._queue_text('account_value_value', format_currency(account_value))
+        self._queue_text('starting_value_value', format_currency(starting_value))
+        self._queue_text('high_water_value', format_currency(high_water_mark))
+        return True
             
     def update_active_contracts_pnl(self, active_contracts_pnl: Dict[str, Any]):
         try:
 
             if active_contracts_pnl['position_size'] == 0:
-                logger.info(f"No active contracts PNL found")
-                self.ui.label_pl_percent_value.setText(f"---")
-                self.ui.label_pl_dollar_value.setText(f"---")
-                self.ui.label_quantity_value.setText(f"---")
-                self.ui.label_symbol_value.setText(f"---")
+                logger.info("No active contracts PNL found")
+                self._queue_text('pl_percent_value', _DASH)
+                self._queue_text('pl_dollar_value', _DASH)
+                self._queue_text('quantity_value', _DASH)
+                self._queue_text('symbol_value', _DASH)
             else:
-                logger.info(f"Updating active contracts PNL: {active_contracts_pnl}")
+                logger.info("Updating active contracts PNL: %s", active_contracts_pnl)
                 if active_contracts_pnl["pnl_dollar"] == 0 and active_contracts_pnl["pnl_dollar"] == -1:
                     logger.info("Marketplace is close and can't calculate the PNL")
-                    self.ui.label_pl_dollar_value.setText(f"---")
-                    self.ui.label_pl_percent_value.setText(f"---")
+                    self._queue_text('pl_dollar_value', _DASH)
+                    self._queue_text('pl_percent_value', _DASH)
                 else:
-                    self.ui.label_pl_dollar_value.setText(format_currency(active_contracts_pnl.get('pnl_dollar', 0)))
-                    self.ui.label_pl_percent_value.setText(f"{active_contracts_pnl.get('pnl_percent', '---')}%")
+                    self._queue_text('pl_dollar_value', format_currency(active_contracts_pnl.get('pnl_dollar', 0)))
+                    self._queue_text('pl_percent_value', _FMT_PCT(active_contracts_pnl.get('pnl_percent', _DASH)))
 
-                self.ui.label_quantity_value.setText(f"{active_contracts_pnl['position_size']}")
-                self.ui.label_symbol_value.setText(f"{active_contracts_pnl['symbol']}")
+                self._queue_text('quantity_value', f"{active_contracts_pnl['position_size']}")
+                self._queue_text('symbol_value', f"{active_contracts_pnl['symbol']}")
         except Exception as e:
             logger.error(f"Error updating active contracts PNL: {e}")
 
     def update_closed_trades(self, stats: Dict[str, Any]):
         try:
-            logger.info(f"Updating closed trades: {stats}")
-            self.ui.label_total_trades_value.setText(f"{stats['Total_Trades']}")
-            self.ui.label_total_wins_count_value.setText(f"{stats['Total_Wins_Count']}")
-            self.ui.label_total_losses_count_value.setText(f"{stats['Total_Losses_Count']}")
-            self.ui.label_total_losses_sum_value.setText(format_currency(-abs(stats['Total_Losses_Sum'])))
-            self.ui.label_total_wins_sum_value.setText(format_currency(stats['Total_Wins_Sum']))
+            logger.info("Updating closed trades: %s", stats)
+            self._apply_map(self._STATS_MAP, stats)
         except Exception as e:
             logger.error(f"Error updating closed trades: {e}")
 
+    def _apply_pending_data(self):
+        """Apply the data_ready payload held back by the UI rate limit"""
+        if self._pending_data is not None:
+            self.update_ui_with_data(self._pending_data)
+
     def refresh_ui(self):
-        """Refresh UI elements that need frequent updates"""
-        # Update the time label with current time
-        current_time = datetime.now().strftime("%I:%M:%S %p")
-        if hasattr(self.ui, 'label_time'):
-            self.ui.label_time.setText(current_time)
+        """Refresh the clock label"""
+        # QTime reads local time (DST included) in C++; write only when the second rolls over
+        now = QTime.currentTime()
+        self.refresh_timer.start(1000 - now.msec())
+        s = now.msecsSinceStartOfDay() // 1000
+        if s == self._last_sec:
+            return
+        self._last_sec = s
+        self._set_time_text(now.toString("hh:mm:ss AP"))
     
     def keyPressEvent(self, event):
         """Handle key press events for hotkey detection"""
@@ -1124,113 +1357,159 @@ class IB_Trading_APP(QMainWindow):
     def closeEvent(self, event):
         """Handle application shutdown"""
         try:
-            # Stop AI engine
-            if hasattr(self, 'ai_engine') and self.ai_engine:
-                try:
-                    self.ai_engine.cleanup()
-                except Exception as e:
-                    logger.error(f"Error stopping AI engine: {e}")
-            
-            # Stop hotkey manager
-            if hasattr(self, 'hotkey_manager') and self.hotkey_manager:
-                try:
-                    self.hotkey_manager.stop()
-                except Exception as e:
-                    logger.error(f"Error stopping hotkey manager: {e}")
-            
-            # Stop data collection
-            if hasattr(self, 'data_worker') and self.data_worker:
-                try:
-                    self.data_worker.stop_collection()
-                except Exception as e:
-                    logger.error(f"Error stopping data collection: {e}")
-            
-            # Wait for thread to finish
-            if hasattr(self, 'worker_thread') and self.worker_thread and self.worker_thread.isRunning():
-                try:
-                    self.worker_thread.quit()
-                    self.worker_thread.wait(5000)  # Wait up to 5 seconds
-                except Exception as e:
-                    logger.error(f"Error stopping worker thread: {e}")
+            if not self._shutting_down:
+                self._shutting_down = True
+                self._begin_shutdown()
+            
+            # Keep the window hidden while the collection loop winds down instead of
+            # blocking the GUI thread; worker_thread.finished closes us again
+            if self.worker_thread and self.worker_thread.isRunning() and not self._shutdown_timed_out:
+                self.hide()
+                event.ignore()
+                return
             
-            # Save configuration
-            if hasattr(self, 'config') and self.config:
-                try:
-                    self.config.save_to_file()
-                except Exception as e:
-                    logger.error(f"Error saving configuration: {e}")
+            # Save configuration on the saver thread, behind any queued settings saves; the
+            # write is atomic, so a slow disk only costs FINAL_SAVE_TIMEOUT_MS of shutdown
+            has_config = hasattr(self, 'config') and self.config
+            try:
+                if hasattr(self, '_saver_thread') and self._saver_thread.isRunning():
+                    if has_config:
+                        self._saver.request_final_save(self.config)
+                    else:
+                        self._saver_thread.quit()
+                    if not self._saver_thread.wait(self.FINAL_SAVE_TIMEOUT_MS):
+                        logger.warning("Configuration save still running at shutdown")
+                elif has_config:
+                    self.config.save_to_file_fast()
+            except Exception as e:
+                logger.error(f"Error saving configuration: {e}")
             
             logger.info("Application shutdown completed")
             event.accept()
+            self._quit_after_deferred_close()
             
         except Exception as e:
             logger.error(f"Error during shutdown: {e}")
             event.accept()
+            self._quit_after_deferred_close()
+
+    def _quit_after_deferred_close(self):
+        """Quit the event loop once a close that was deferred behind the worker is accepted"""
+        # Qt only quits on last-window-closed for a window that was visible when its close was
+        # accepted; a close deferred behind the worker thread happens after we hid the window
+        if not self.isHidden():
+            return
+        if self.worker_thread and self.worker_thread.isRunning():
+            logger.error("Quitting with the data collection thread still running")
+        QCoreApplication.quit()
+
+    def _begin_shutdown(self):
+        """Stop background services and ask the worker thread to finish"""
+        # Stop AI engine
+        if hasattr(self, 'ai_engine') and self.ai_engine:
+            try:
+                self.ai_engine.cleanup()
+            except Exception as e:
+                logger.error(f"Error stopping AI engine: {e}")
+        
+        # Stop hotkey manager
+        if hasattr(self, 'hotkey_manager') and self.hotkey_manager:
+            try:
+                self.hotkey_manager.stop()
+            except Exception as e:
+                logger.error(f"Error stopping hotkey manager: {e}")
+        
+        # Stop data collection; the loop checks this flag between short sleeps
+        if self.data_worker:
+            try:
+                self.data_worker.stop_collection()
+            except Exception as e:
+                logger.error(f"Error stopping data collection: {e}")
+        
+        # Single-thread mode has no QThread whose finished signal runs cleanup
+        if self.poll_timer:
+            self.poll_timer.stop()
+            try:
+                self.data_worker.cleanup()
+            except Exception as e:
+                logger.error(f"Error cleaning up data worker: {e}")
+        
+        # Ask the worker thread to exit and finish closing once it has
+        if self.worker_thread and self.worker_thread.isRunning():
+            try:
+                self.worker_thread.finished.connect(self.close)
+                self.worker_thread.quit()
+                QTimer.singleShot(self.SHUTDOWN_TIMEOUT_MS, self._on_shutdown_timeout)
+            except Exception as e:
+                logger.error(f"Error stopping worker thread: {e}")
+
+    def _on_shutdown_timeout(self):
+        """Close even though the worker thread has not finished yet"""
+        if self.worker_thread and self.worker_thread.isRunning():
+            logger.warning("Data collection thread did not stop in time; closing anyway")
+            self._shutdown_timed_out = True
+            self.close()
+
+    def _trading_manager_or_warn(self, title: str, capability: str, unsupported: str):
+        """Resolve the collector's trading manager, or warn and return None"""
+        worker = getattr(self, 'data_worker', None)
+        collector = getattr(worker, 'collector', None) if worker else None
+        if not worker:
+            reason = "No data worker available"
+        elif not collector:
+            reason = "No collector available"
+        elif (trading_manager := getattr(collector, 'trading_manager', None)) is None:
+            reason = "No trading manager available"
+        elif not hasattr(trading_manager, capability):
+            reason = unsupported
+        else:
+            return trading_manager
+        QMessageBox.warning(self, title, reason)
+        return None
 
     def show_expiration_status(self):
         """Show the current expiration status and available expirations"""
         try:
-            if hasattr(self, 'data_worker') and self.data_worker:
-                if hasattr(self.data_worker, 'collector') and self.data_worker.collector:
-                    if hasattr(self.data_worker.collector, 'trading_manager'):
-                        trading_manager = self.data_worker.collector.trading_manager
-                        if hasattr(trading_manager, 'get_expiration_status'):
-                            status = trading_manager.get_expiration_status()
-                            
-                            if 'error' in status:
-                                QMessageBox.warning(
-                                    self,
-                                    "Expiration Status Error",
-                                    f"Could not retrieve expiration status: {status['error']}"
-                                )
-                                return
-                            
-                            # Format status message
-                            message = f"""Expiration Status:
-                            
-Current Expiration: {status.get('current_expiration', 'N/A')}
-Type: {status.get('current_expiration_type', 'N/A')}
-Available Expirations: {status.get('available_expirations_count', 0)}
-Next Recommended: {status.get('next_recommended_expiration', 'N/A')}
-Should Switch: {status.get('should_switch', False)}
-Current Time (EST): {status.get('current_time_est', 'N/A')}"""
-                            
-                            # Add expiration analysis if available
-                            if 'expiration_analysis' in status:
-                                message += "\n\nExpiration Analysis:"
-                                for exp in status['expiration_analysis'][:5]:  # Show first 5
-                                    current_marker = " (CURRENT)" if exp.get('is_current', False) else ""
-                                    message += f"\n• {exp.get('expiration', 'N/A')} - {exp.get('type', 'N/A')} - {exp.get('days_diff', 'N/A')} days{current_marker}"
-                            
-                            QMessageBox.information(
-                                self,
-                                "Expiration Status",
-                                message
-                            )
-                        else:
-                            QMessageBox.warning(
-                                self,
-                                "Expiration Status",
-                                "Trading manager doesn't support expiration status retrieval"
-                            )
-                    else:
-                        QMessageBox.warning(
-                            self,
-                            "Expiration Status",
-                            "No trading manager available"
-                        )
-                else:
-                    QMessageBox.warning(
-                        self,
-                        "Expiration Status",
-                        "No collector available"
-                    )
-            else:
+            trading_manager = self._trading_manager_or_warn(
+                "Expiration Status", 'get_expiration_status',
+                "Trading manager doesn't support expiration status retrieval"
+            )
+            if trading_manager is None:
+                return
+            status = trading_manager.get_expiration_status()
+            
+            if 'error' in status:
                 QMessageBox.warning(
                     self,
-                    "Expiration Status",
-                    "No data worker available"
+                    "Expiration Status Error",
+                    f"Could not retrieve expiration status: {status['error']}"
                 )
+                return
+            
+            # Format status message
+            parts = [
+                "Expiration Status:",
+                "",
+                f"Current Expiration: {status.get('current_expiration', _NA)}",
+                f"Type: {status.get('current_expiration_type', _NA)}",
+                f"Available Expirations: {status.get('available_expirations_count', 0)}",
+                f"Next Recommended: {status.get('next_recommended_expiration', _NA)}",
+                f"Should Switch: {status.get('should_switch', False)}",
+                f"Current Time (EST): {status.get('current_time_est', _NA)}",
+            ]
+            
+            # Add expiration analysis if available
+            if 'expiration_analysis' in status:
+                parts += ("", "Expiration Analysis:")
+                for exp in status['expiration_analysis'][:5]:  # Show first 5
+                    current_marker = " (CURRENT)" if exp.get('is_current', False) else ""
+                    parts.append(f"• {exp.get('expiration', _NA)} - {exp.get('type', _NA)} - {exp.get('days_diff', _NA)} days{current_marker}")
+            
+            QMessageBox.information(
+                self,
+                "Expiration Status",
+                "\n".join(parts)
+            )
                 
         except Exception as e:
             logger.error(f"Error showing expiration status: {e}")
@@ -1243,81 +1522,60 @@ Current Time (EST): {status.get('current_time_est', 'N/A')}"""
     def manual_expiration_switch(self):
         """Manually trigger expiration switching"""
         try:
-            if hasattr(self, 'data_worker') and self.data_worker:
-                if hasattr(self.data_worker, 'collector') and self.data_worker.collector:
-                    if hasattr(self.data_worker.collector, 'trading_manager'):
-                        trading_manager = self.data_worker.collector.trading_manager
-                        if hasattr(trading_manager, 'manual_expiration_switch'):
-                            # Get current status first
-                            status = trading_manager.get_expiration_status()
-                            if 'error' in status:
-                                QMessageBox.warning(
-                                    self,
-                                    "Manual Switch Error",
-                                    f"Could not get current status: {status['error']}"
-                                )
-                                return
-                            
-                            # Show current status and ask for confirmation
-                            current_exp = status.get('current_expiration', 'N/A')
-                            next_exp = status.get('next_recommended_expiration', 'N/A')
-                            
-                            if next_exp and next_exp != current_exp:
-                                reply = QMessageBox.question(
-                                    self,
-                                    "Manual Expiration Switch",
-                                    f"Current expiration: {current_exp}\n"
-                                    f"Recommended next: {next_exp}\n\n"
-                                    f"Switch to recommended expiration?",
-                                    QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No
-                                )
-                                
-                                if reply == QMessageBox.StandardButton.Yes:
-                                    success = trading_manager.manual_expiration_switch(next_exp)
-                                    if success:
-                                        QMessageBox.information(
-                                            self,
-                                            "Switch Successful",
-                                            f"Successfully switched to {next_exp}"
-                                        )
-                                        # Refresh the display
-                                        self.refresh_ui()
-                                    else:
-                                        QMessageBox.warning(
-                                            self,
-                                            "Switch Failed",
-                                            "Failed to switch expiration. Check logs for details."
-                                        )
-                            else:
-                                QMessageBox.information(
-                                    self,
-                                    "No Switch Needed",
-                                    f"Current expiration {current_exp} is already optimal or no better expiration available."
-                                )
-                        else:
-                            QMessageBox.warning(
-                                self,
-                                "Manual Switch",
-                                "Trading manager doesn't support manual expiration switching"
-                            )
-                    else:
-                        QMessageBox.warning(
-                            self,
-                            "Manual Switch",
-                            "No trading manager available"
-                        )
+            trading_manager = self._trading_manager_or_warn(
+                "Manual Switch", 'manual_expiration_switch',
+                "Trading manager doesn't support manual expiration switching"
+            )
+            if trading_manager is None:
+                return
+            
+            # Get current status first
+            status = trading_manager.get_expiration_status()
+            if 'error' in status:
+                QMessageBox.warning(
+                    self,
+                    "Manual Switch Error",
+                    f"Could not get current status: {status['error']}"
+                )
+                return
+            
+            # Show current status and ask for confirmation
+            current_exp = status.get('current_expiration', 'N/A')
+            next_exp = status.get('next_recommended_expiration', 'N/A')
+            
+            if not next_exp or next_exp == current_exp:
+                QMessageBox.information(
+                    self,
+                    "No Switch Needed",
+                    f"Current expiration {current_exp} is already optimal or no better expiration available."
+                )
+                return
+            
+            reply = QMessageBox.question(
+                self,
+                "Manual Expiration Switch",
+                f"Current expiration: {current_exp}\n"
+                f"Recommended next: {next_exp}\n\n"
+                "Switch to recommended expiration?",
+                QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No
+            )
+            
+            if reply == QMessageBox.StandardButton.Yes:
+                success = trading_manager.manual_expiration_switch(next_exp)
+                if success:
+                    QMessageBox.information(
+                        self,
+                        "Switch Successful",
+                        f"Successfully switched to {next_exp}"
+                    )
+                    # Refresh the display
+                    self.refresh_ui()
                 else:
                     QMessageBox.warning(
                         self,
-                        "Manual Switch",
-                        "No collector available"
+                        "Switch Failed",
+                        "Failed to switch expiration. Check logs for details."
                     )
-            else:
-                QMessageBox.warning(
-                    self,
-                    "Manual Switch",
-                    "No data worker available"
-                )
                 
         except Exception as e:
             logger.error(f"Error in manual expiration switch: {e}")
@@ -1326,4 +1584,3 @@ Current Time (EST): {status.get('current_time_est', 'N/A')}"""
                 "Error",
                 f"Failed to perform manual expiration switch: {str(e)}"
             )
-
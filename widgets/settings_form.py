@@ -1,13 +1,57 @@
 from PyQt6.QtWidgets import QDialog
+from PyQt6.QtCore import QTimer
 from PyQt6 import QtWidgets
 from utils.config_manager import AppConfig
 from ui.settings_gui import Ui_PreferencesDialog
 from utils.logger import get_logger, update_log_levels, get_available_modules, get_all_log_levels
-from datetime import datetime
+import time
+from types import MappingProxyType
 
 logger = get_logger("SETTINGS")
 
+# Connection status label stylesheets
+_CSS_GREEN = "color: green;"
+_CSS_RED = "color: red;"
+_CSS_ORANGE = "color: orange;"
+# Connection status label text
+_STATUS_FMT = "Connection: {}".format
+# Connection log timestamp
+_TS_FMT = "%I:%M:%S %p"
+# (logger module, combo box) pairs for the per-module log levels; the main window's
+# settings save reads the same table
+LOG_LEVEL_COMBOS = (
+    ("TRADING_MANAGER", "tradingManagerLogLevelCombo"),
+    ("GUI", "guiLogLevelCombo"),
+    ("IB_CONNECTION", "ibConnectionLogLevelCombo"),
+    ("DATA_COLLECTOR", "dataCollectorLogLevelCombo"),
+    ("CONFIG_MANAGER", "configManagerLogLevelCombo"),
+    ("AI_ENGINE", "aiEngineLogLevelCombo"),
+)
+
 class Settings_Form(QDialog):
+    # Risk level fields in riskLevelsTable column order
+    _RISK_LEVEL_KEYS = ("loss_threshold", "account_trade_limit", "stop_loss", "profit_gain")
+    # Settled status -> (label stylesheet, connect button text, connection log entry)
+    _SETTLED_STATUS = {
+        'Connected': (_CSS_GREEN, "Disconnect", "Connection established successfully"),
+        'Disconnected': (_CSS_RED, "Connect", "Connection disconnected"),
+    }
+    # Delay used to coalesce connection log appends
+    LOG_FLUSH_INTERVAL_MS = 100
+    # Most paragraphs kept in the connection log
+    LOG_MAX_BLOCKS = 1000
+    # How long a manual disconnect may stay pending before the form checks the connection
+    DISCONNECT_TIMEOUT_MS = 10000
+    # Legacy log level names mapped to the standard levels offered by the combo boxes
+    _LEVEL_MAPPING = MappingProxyType({
+        "Trace": "TRACE",
+        "Info": "INFO",
+        "Debug": "DEBUG",
+        "Warning": "WARN",
+        "Error": "ERROR",
+        "Critical": "FATAL",
+    })
+
     def __init__(self, config: AppConfig = None, connection_status: str = None, data_worker=None):
         super().__init__()
         self.ui = Ui_PreferencesDialog()
@@ -15,24 +59,51 @@ class Settings_Form(QDialog):
         self.config = config
         self.connection_status = connection_status
         self.data_worker = data_worker
-        if self.config:
+        # Connection widgets touched on every status change and log entry
+        self._status_label = getattr(self.ui, 'connectionStatusLabel', None)
+        self._connect_btn = getattr(self.ui, 'connectButton', None)
+        self._log_text = getattr(self.ui, 'connectionLogText', None)
+        # Connection log entries waiting for the next coalesced append
+        self._log_pending = []
+        self._log_timer = QTimer(self)
+        self._log_timer.setSingleShot(True)
+        self._log_timer.setInterval(self.LOG_FLUSH_INTERVAL_MS)
+        self._log_timer.timeout.connect(self._flush_connection_log)
+        if self._log_text is not None:
+            # Keep the log bounded; the oldest lines are dropped
+            self._log_text.document().setMaximumBlockCount(self.LOG_MAX_BLOCKS)
+        # Everything past setupUi is deferred to the first showEvent
+        self._initialized = False
+        self._config_loaded = False
+
+    def showEvent(self, event):
+        """Finish building the form the first time it is shown"""
+        if not self._initialized:
+            self._initialized = True
+            self._populate()
+        super().showEvent(event)
+
+    def _populate(self):
+        """Load config values and wire the connection and log level widgets"""
+        # The owner usually loads the config right before showing the form
+        if self.config and not self._config_loaded:
             self.load_config_values()
         
         # Set connection status safely
-        if hasattr(self.ui, 'connectionStatusLabel'):
-            self.ui.connectionStatusLabel.setText("Connection: " + (self.connection_status or "Disconnected"))
+        if self._status_label is not None:
+            self._status_label.setText(_STATUS_FMT(self.connection_status or "Disconnected"))
             if self.connection_status == 'Connected':
-                self.ui.connectionStatusLabel.setStyleSheet("color: green;")
+                self._status_label.setStyleSheet(_CSS_GREEN)
             else:
-                self.ui.connectionStatusLabel.setStyleSheet("color: red;")
+                self._status_label.setStyleSheet(_CSS_RED)
         
-        if hasattr(self.ui, 'connectButton'):
+        if self._connect_btn is not None:
             if self.connection_status == 'Connected':
-                self.ui.connectButton.setText("Disconnect")
+                self._connect_btn.setText("Disconnect")
             else:
-                self.ui.connectButton.setText("Connect")
+                self._connect_btn.setText("Connect")
                 
-        self.ui.connectButton.clicked.connect(self.connect_button_clicked)
+        self._connect_btn.clicked.connect(self.connect_button_clicked)
         
         # Add initial log message
         self.log_connection_event("Connection log initialized", "Info")
@@ -43,6 +114,8 @@ class Settings_Form(QDialog):
     def load_config_values(self):
         """Load configuration values into the UI"""
         try:
+            self._config_loaded = True
+            
             # Load connection settings
             if self.config.connection:
                 self.ui.hostEdit.setText(str(self.config.connection.get("host", "127.0.0.1")))
@@ -60,21 +133,26 @@ class Settings_Form(QDialog):
                 risk_levels = self.config.trading.get("risk_levels", [])
                 table = self.ui.riskLevelsTable
                 
-                # Set table row count to match risk levels
-                if len(risk_levels) > table.rowCount():
-                    table.setRowCount(len(risk_levels))
-                
-                for row, risk_level in enumerate(risk_levels):
-                    # Ensure items exist in table cells
-                    for col in range(4):
-                        if not table.item(row, col):
-                            table.setItem(row, col, QtWidgets.QTableWidgetItem())
+                # Fill with fresh items while painting, signals and sorting are suspended
+                table.setUpdatesEnabled(False)
+                table.blockSignals(True)
+                was_sorting = table.isSortingEnabled()
+                table.setSortingEnabled(False)
+                try:
+                    # Grow the table to fit the risk levels; extra rows stay available for new ones
+                    if len(risk_levels) > table.rowCount():
+                        table.setRowCount(len(risk_levels))
                     
-                    # Set values
-                    table.item(row, 0).setText(str(risk_level.get("loss_threshold", "")))
-                    table.item(row, 1).setText(str(risk_level.get("account_trade_limit", "")))
-                    table.item(row, 2).setText(str(risk_level.get("stop_loss", "")))
-                    table.item(row, 3).setText(str(risk_level.get("profit_gain", "")))
+                    item = QtWidgets.QTableWidgetItem
+                    keys = self._RISK_LEVEL_KEYS
+                    for row, risk_level in enumerate(risk_levels):
+                        rl_get = risk_level.get
+                        for col, key in enumerate(keys):
+                            table.setItem(row, col, item(str(rl_get(key, ""))))
+                finally:
+                    table.setSortingEnabled(was_sorting)
+                    table.blockSignals(False)
+                    table.setUpdatesEnabled(True)
             
             # Load debug settings
             if self.config.debug:
@@ -83,58 +161,41 @@ class Settings_Form(QDialog):
                 # Load module log levels
                 modules = self.config.debug.get("modules", {})
                 
-                # Set combo box values
-                if "TRADING_MANAGER" in modules:
-                    self._set_combo_text(self.ui.tradingManagerLogLevelCombo, modules["TRADING_MANAGER"])
-                if "GUI" in modules:
-                    self._set_combo_text(self.ui.guiLogLevelCombo, modules["GUI"])
-                if "IB_CONNECTION" in modules:
-                    self._set_combo_text(self.ui.ibConnectionLogLevelCombo, modules["IB_CONNECTION"])
-                if "DATA_COLLECTOR" in modules:
-                    self._set_combo_text(self.ui.dataCollectorLogLevelCombo, modules["DATA_COLLECTOR"])
-                if "CONFIG_MANAGER" in modules:
-                    self._set_combo_text(self.ui.configManagerLogLevelCombo, modules["CONFIG_MANAGER"])
-                if "AI_ENGINE" in modules:
-                    self._set_combo_text(self.ui.aiEngineLogLevelCombo, modules["AI_ENGINE"])
+                # Set combo box values, one lookup per module
+                for module, attr in LOG_LEVEL_COMBOS:
+                    level = modules.get(module)
+                    combo = getattr(self.ui, attr, None)
+                    if level is not None and combo is not None:
+                        self._set_combo_text(combo, level)
                     
         except Exception as e:
             logger.error(f"Error loading config values into UI: {e}")
     
     def _set_combo_text(self, combo, text):
         """Helper method to set combo box text"""
-        try:
-            # Map common log level names to new standard levels
-            level_mapping = {
-                "Trace": "TRACE",
-                "Info": "INFO", 
-                "Debug": "DEBUG",
-                "Warning": "WARN",
-                "Error": "ERROR",
-                "Critical": "FATAL"
-            }
-            
-            # Use mapping if available, otherwise use text as-is
-            mapped_text = level_mapping.get(text, text.upper())
-            
-            index = combo.findText(mapped_text)
-            if index >= 0:
-                combo.setCurrentIndex(index)
-        except Exception as e:
-            logger.warning(f"Could not set combo text '{text}': {e}")
+        # Use mapping if available, otherwise use text as-is
+        mapped_text = self._LEVEL_MAPPING.get(text) or (text.upper() if isinstance(text, str) else str(text))
+        
+        index = combo.findText(mapped_text)
+        if index >= 0:
+            combo.setCurrentIndex(index)
+        else:
+            logger.warning(f"Could not set combo text '{text}': no such log level")
             
     def get_current_connection_settings(self):
         """Get current connection settings from the UI"""
         try:
             host = self.ui.hostEdit.text().strip()
-            port = int(self.ui.portEdit.text().strip())
-            client_id = int(self.ui.clientIdEdit.text().strip())
+            # int() already ignores surrounding whitespace
+            port = int(self.ui.portEdit.text())
+            client_id = int(self.ui.clientIdEdit.text())
             
             # Validate settings
             if not host:
                 logger.error("Host cannot be empty")
                 return None
             
-            if port <= 0 or port > 65535:
+            if not 0 < port <= 65535:
                 logger.error(f"Invalid port number: {port}")
                 return None
             
@@ -162,26 +223,35 @@ class Settings_Form(QDialog):
     def log_connection_event(self, message: str, level: str = "Info"):
         """Log a connection event to the connectionLogText widget"""
         try:
-            if hasattr(self.ui, 'connectionLogText'):
+            if self._log_text is not None:
                 # Get current timestamp
-                timestamp = datetime.now().strftime("%I:%M:%S %p")
-                
-                # Format the log message
-                log_entry = f"[{timestamp}] {level}: {message}\n"
+                timestamp = time.strftime(_TS_FMT)
                 
-                # Append to the text widget
-                self.ui.connectionLogText.append(log_entry)
-                
-                # Auto-scroll to the bottom
-                cursor = self.ui.connectionLogText.textCursor()
-                cursor.movePosition(cursor.MoveOperation.End)
-                self.ui.connectionLogText.setTextCursor(cursor)
+                # Queue the log message; bursts are appended in one layout pass
+                self._log_pending.append(f"[{timestamp}] {level}: {message}\n")
+                if not self._log_timer.isActive():
+                    self._log_timer.start()
                 
                 logger.info(f"Connection log: {message}")
             else:
                 logger.warning("connectionLogText widget not found in UI")
         except Exception as e:
             logger.error(f"Error logging to connection log: {e}")
+
+    def _flush_connection_log(self):
+        """Append the queued log entries and scroll to the bottom once"""
+        pending, self._log_pending = self._log_pending, []
+        if not pending:
+            return
+        try:
+            self._log_text.append("\n".join(pending))
+            
+            # Auto-scroll to the bottom
+            cursor = self._log_text.textCursor()
+            cursor.movePosition(cursor.MoveOperation.End)
+            self._log_text.setTextCursor(cursor)
+        except Exception as e:
+            logger.error(f"Error logging to connection log: {e}")
             
     def connect_button_clicked(self):
         """Handle connect button click"""
@@ -191,40 +261,31 @@ class Settings_Form(QDialog):
                 try:
                     self.log_connection_event("Manual disconnect requested", "Info")
                     logger.info("Disconnecting from IB via DataCollectorWorker")
-                    self.data_worker.disconnect_from_ib()
+                    # Show the pending state first: the worker's connection_disconnected
+                    # signal reaches this form through the main window's status handler
                     self.connection_status = 'Disconnecting...'
-                    self.ui.connectionStatusLabel.setText("Connection: " + self.connection_status)
-                    self.ui.connectionStatusLabel.setStyleSheet("color: orange;")
-                    self.ui.connectButton.setText("Disconnecting...")
-                    self.ui.connectButton.setEnabled(False)
-                    
-                    # Set up a timer to check if disconnect completed and update button state
-                    from PyQt6.QtCore import QTimer
-                    def check_disconnect_status():
-                        if not self.data_worker.collector.ib.isConnected():
-                            logger.info("Disconnect completed, updating button state")
-                            self.log_connection_event("Disconnect completed successfully", "Info")
-                            self.update_connection_status('Disconnected')
-                        else:
-                            # Still connected, try again in 1 second
-                            QTimer.singleShot(1000, check_disconnect_status)
+                    self._status_label.setText(_STATUS_FMT(self.connection_status))
+                    self._status_label.setStyleSheet(_CSS_ORANGE)
+                    self._connect_btn.setText("Disconnecting...")
+                    self._connect_btn.setEnabled(False)
+                    self.data_worker.disconnect_from_ib()
                     
-                    # Check after 2 seconds
-                    QTimer.singleShot(2000, check_disconnect_status)
+                    # Safety net in case the disconnect signal never arrives
+                    QTimer.singleShot(self.DISCONNECT_TIMEOUT_MS, self._check_disconnect_timeout)
                     
                 except Exception as e:
                     logger.error(f"Error disconnecting from IB: {e}")
                     self.log_connection_event(f"Error disconnecting: {str(e)}", "Error")
-                    self.ui.connectionStatusLabel.setText("Connection: Error disconnecting")
-                    self.ui.connectionStatusLabel.setStyleSheet("color: red;")
+                    self._status_label.setText("Connection: Error disconnecting")
+                    self._status_label.setStyleSheet(_CSS_RED)
                     # Re-enable button on error
-                    self.ui.connectButton.setEnabled(True)
-                    self.ui.connectButton.setText("Disconnect")
+                    self._connect_btn.setEnabled(True)
+                    self._connect_btn.setText("Disconnect")
             else:
                 logger.warning("No data worker available for disconnection")
                 self.log_connection_event("No data worker available for disconnection", "Warning")
-                self.ui.connectionStatusLabel.setText("Connection: No data worker")
-                self.ui.connectionStatusLabel.setStyleSheet("color: red;")
+                self._status_label.setText("Connection: No data worker")
+                self._status_label.setStyleSheet(_CSS_RED)
         else:
             # Connect to IB
             if self.data_worker and hasattr(self.data_worker, 'connect_to_ib'):
@@ -239,62 +300,80 @@ class Settings_Form(QDialog):
                         self.data_worker.connect_to_ib(connection_settings)
                         
                         self.connection_status = 'Connecting...'
-                        self.ui.connectionStatusLabel.setText("Connection: " + self.connection_status)
-                        self.ui.connectionStatusLabel.setStyleSheet("color: orange;")
-                        self.ui.connectButton.setText("Connecting...")
-                        self.ui.connectButton.setEnabled(False)
+                        self._status_label.setText(_STATUS_FMT(self.connection_status))
+                        self._status_label.setStyleSheet(_CSS_ORANGE)
+                        self._connect_btn.setText("Connecting...")
+                        self._connect_btn.setEnabled(False)
                     else:
                         logger.warning("Invalid connection settings, cannot connect")
                         self.log_connection_event("Invalid connection settings, cannot connect", "Error")
-                        self.ui.connectionStatusLabel.setText("Connection: Invalid settings")
-                        self.ui.connectionStatusLabel.setStyleSheet("color: red;")
+                        self._status_label.setText("Connection: Invalid settings")
+                        self._status_label.setStyleSheet(_CSS_RED)
                         # Keep button enabled and show "Connect" text
-                        self.ui.connectButton.setEnabled(True)
-                        self.ui.connectButton.setText("Connect")
+                        self._connect_btn.setEnabled(True)
+                        self._connect_btn.setText("Connect")
                         
                 except Exception as e:
                     logger.error(f"Error connecting to IB: {e}")
                     self.log_connection_event(f"Error connecting: {str(e)}", "Error")
-                    self.ui.connectionStatusLabel.setText("Connection: Error connecting")
-                    self.ui.connectionStatusLabel.setStyleSheet("color: red;")
+                    self._status_label.setText("Connection: Error connecting")
+                    self._status_label.setStyleSheet(_CSS_RED)
                     # Re-enable button on error
-                    self.ui.connectButton.setEnabled(True)
-                    self.ui.connectButton.setText("Connect")
+                    self._connect_btn.setEnabled(True)
+                    self._connect_btn.setText("Connect")
             else:
                 logger.warning("No data worker available for connection")
                 self.log_connection_event("No data worker available for connection", "Warning")
-                self.ui.connectionStatusLabel.setText("Connection: No data worker")
-                self.ui.connectionStatusLabel.setStyleSheet("color: red;")
+                self._status_label.setText("Connection: No data worker")
+                self._status_label.setStyleSheet(_CSS_RED)
+    
+    def _check_disconnect_timeout(self):
+        """Resolve a manual disconnect that no status signal has finished"""
+        if self.connection_status != 'Disconnecting...':
+            return
+        collector = getattr(self.data_worker, 'collector', None)
+        if collector is None or not collector.ib.isConnected():
+            logger.info("Disconnect completed, updating button state")
+            self.log_connection_event("Disconnect completed successfully", "Info")
+            self.update_connection_status('Disconnected')
+            return
+        logger.error("Disconnect did not complete within the timeout")
+        self.log_connection_event("Disconnect did not complete", "Error")
+        # Still connected: let the user retry the disconnect
+        self.connection_status = 'Connected'
+        self._status_label.setText(_STATUS_FMT(self.connection_status))
+        self._status_label.setStyleSheet(_CSS_GREEN)
+        self._connect_btn.setText("Disconnect")
+        self._connect_btn.setEnabled(True)
     
     def update_connection_status(self, status: str):
         """Update connection status from external source (e.g., signal handlers)"""
+        # Already showing this status: skip the restyle, relayout and log entry
+        if status == self.connection_status:
+            return
         logger.info(f"Settings form: Updating connection status to: {status}")
         self.connection_status = status
         
-        if hasattr(self.ui, 'connectionStatusLabel'):
-            self.ui.connectionStatusLabel.setText("Connection: " + status)
-            if status == 'Connected':
-                self.ui.connectionStatusLabel.setStyleSheet("color: green;")
-                self.ui.connectButton.setText("Disconnect")
-                self.log_connection_event("Connection established successfully", "Info")
-                logger.info("Settings form: Button set to 'Disconnect'")
-            elif status == 'Disconnected':
-                self.ui.connectionStatusLabel.setStyleSheet("color: red;")
-                self.ui.connectButton.setText("Connect")
-                self.log_connection_event("Connection disconnected", "Info")
-                logger.info("Settings form: Button set to 'Connect'")
+        if self._status_label is not None:
+            self._status_label.setText(_STATUS_FMT(status))
+            settled = self._SETTLED_STATUS.get(status)
+            if settled is not None:
+                css, button_text, event = settled
+                self._status_label.setStyleSheet(css)
+                self._connect_btn.setText(button_text)
+                self.log_connection_event(event, "Info")
             else:
-                self.ui.connectionStatusLabel.setStyleSheet("color: orange;")
-                self.ui.connectButton.setText("Connecting..." if "Connecting" in status else "Disconnecting...")
+                self._status_label.setStyleSheet(_CSS_ORANGE)
+                self._connect_btn.setText("Connecting..." if "Connecting" in status else "Disconnecting...")
                 if "Connecting" in status:
                     self.log_connection_event("Connection attempt in progress...", "Info")
                 elif "Disconnecting" in status:
                     self.log_connection_event("Disconnection in progress...", "Info")
-                logger.info(f"Settings form: Button set to '{self.ui.connectButton.text()}'")
+            logger.info(f"Settings form: Button set to '{self._connect_btn.text()}'")
             
             # Re-enable button
-            self.ui.connectButton.setEnabled(True)
-            logger.info(f"Settings form: Button enabled: {self.ui.connectButton.isEnabled()}")
+            self._connect_btn.setEnabled(True)
+            logger.info(f"Settings form: Button enabled: {self._connect_btn.isEnabled()}")
         else:
             logger.warning("Settings form: connectionStatusLabel not found in UI")
     
@@ -302,35 +381,12 @@ class Settings_Form(QDialog):
         """Connect log level combo boxes to update handlers"""
         try:
             # Connect each combo box to the update function
-            if hasattr(self.ui, 'tradingManagerLogLevelCombo'):
-                self.ui.tradingManagerLogLevelCombo.currentTextChanged.connect(
-                    lambda text: self._on_log_level_changed("TRADING_MANAGER", text)
-                )
-            
-            if hasattr(self.ui, 'guiLogLevelCombo'):
-                self.ui.guiLogLevelCombo.currentTextChanged.connect(
-                    lambda text: self._on_log_level_changed("GUI", text)
-                )
-            
-            if hasattr(self.ui, 'ibConnectionLogLevelCombo'):
-                self.ui.ibConnectionLogLevelCombo.currentTextChanged.connect(
-                    lambda text: self._on_log_level_changed("IB_CONNECTION", text)
-                )
-            
-            if hasattr(self.ui, 'dataCollectorLogLevelCombo'):
-                self.ui.dataCollectorLogLevelCombo.currentTextChanged.connect(
-                    lambda text: self._on_log_level_changed("DATA_COLLECTOR", text)
-                )
-            
-            if hasattr(self.ui, 'configManagerLogLevelCombo'):
-                self.ui.configManagerLogLevelCombo.currentTextChanged.connect(
-                    lambda text: self._on_log_level_changed("CONFIG_MANAGER", text)
-                )
-            
-            if hasattr(self.ui, 'aiEngineLogLevelCombo'):
-                self.ui.aiEngineLogLevelCombo.currentTextChanged.connect(
-                    lambda text: self._on_log_level_changed("AI_ENGINE", text)
-                )
+            for module, attr in LOG_LEVEL_COMBOS:
+                combo = getattr(self.ui, attr, None)
+                if combo is not None:
+                    combo.currentTextChanged.connect(
+                        lambda text, module=module: self._on_log_level_changed(module, text)
+                    )
                 
             logger.info("Log level handlers connected successfully")
             